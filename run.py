@@ -1,4 +1,5 @@
 import os
+from importlib.util import find_spec
 
 import uvicorn
 
@@ -13,9 +14,18 @@ def run_server() -> None:
     host = os.getenv("HOST", "0.0.0.0")
     log_level = os.getenv("LOG_LEVEL", "info" if is_production else "debug")
 
-    reload = not is_production
     use_colors = False if is_production else True
-    workers = int(os.getenv("WORKERS", 1))
+
+    # (2 x cores) + 1 workers in production; WEB_CONCURRENCY (or legacy WORKERS) overrides
+    default_workers = (2 * (os.cpu_count() or 1)) + 1 if is_production else 1
+    workers = int(os.getenv("WEB_CONCURRENCY", os.getenv("WORKERS", default_workers)))
+
+    # Reload runs a single supervised process, so it is never combined with multiple workers
+    reload = not is_production and workers == 1
+
+    # Prefer the C event loop and HTTP parser when installed (uvicorn[standard])
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
 
     uvicorn.run(
         "src.main:app",
@@ -23,6 +33,8 @@ def run_server() -> None:
         port=port,
         reload=reload,
         workers=workers,
+        loop=loop,
+        http=http,
         log_level=log_level,
         use_colors=use_colors,
     )
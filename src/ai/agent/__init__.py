@@ -1,13 +1,9 @@
-from .bill_agent import bill_extraction_node
 from .claim_agent import claim_validation_node
 from .classification_agent import classification_node
-from .discharge_agent import discharge_extraction_node
-from .id_agent import id_extraction_node
+from .extraction_agent import extraction_node
 
 __all__ = [
-    "bill_extraction_node",
     "claim_validation_node",
     "classification_node",
-    "discharge_extraction_node",
-    "id_extraction_node",
+    "extraction_node",
 ]
@@ -4,25 +4,129 @@ This node receives the full set of extracted documents and orchestrates
 LLM-based final validation to ensure reliable claim adjudication.
 """
 
-from datetime import UTC, datetime
+import json
+from datetime import UTC, date, datetime
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langsmith import traceable
 
-from src.ai.graph.state import ClaimState
+from src.ai.cache import cached_structured_invoke
+from src.ai.graph.state import ClaimState, ClassifiedDocument, ExtractedDocument
 from src.ai.prompts import CLAIM_VALIDATION_SYSTEM_PROMPT
-from src.core.llm import get_default_llm
+from src.ai.tracing import summarize_node_inputs
+from src.core.llm import build_system_message, get_structured_llm
 from src.schema.claim_dto import ValidationIssue, ValidationReport
-from src.schema.enum import DocStatus, Severity
+from src.schema.enum import DocStatus, DocumentType, Severity
 from src.utils.logger import log
 
+CLAIM_VALIDATION_SYSTEM_MESSAGE = build_system_message(CLAIM_VALIDATION_SYSTEM_PROMPT)
+
+# Mandatory documents per the validation prompt: at least one bill and one discharge summary
+BILL_DOC_TYPES = frozenset({DocumentType.BILL, DocumentType.PHARMACY_BILL})
+
+
+def _parse_date(value: Any) -> date | None:
+    try:
+        return date.fromisoformat(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
+
+
+def _precheck_claim(
+    docs: list[ExtractedDocument], classified: list[ClassifiedDocument]
+) -> ValidationReport | None:
+    """
+    Decide claims that fail the prompt's deterministic rules without calling the LLM.
+
+    - A missing bill or discharge summary rejects the claim, unless some document was
+      classified as "other" (possibly a failed classification): then it needs manual review.
+    - A discharge before admission, or a bill dated before admission, needs manual review.
+
+    Args:
+        docs: Extracted documents of the claim
+        classified: Classified documents of the claim
+
+    Returns:
+        A ValidationReport when the outcome is certain, else None (escalate to the LLM)
+    """
+    present = {doc.doc_type for doc in docs}
+    missing = []
+    if not present & BILL_DOC_TYPES:
+        missing.append(DocumentType.BILL)
+    if DocumentType.DISCHARGE_SUMMARY not in present:
+        missing.append(DocumentType.DISCHARGE_SUMMARY)
+
+    if missing:
+        reason = f"Missing mandatory document(s): {' and '.join(t.value for t in missing)}"
+        unclassified = sum(doc.doc_type == DocumentType.OTHER for doc in classified)
+        if unclassified:
+            # The missing document may be one that could not be classified
+            return ValidationReport(
+                status=DocStatus.MANUAL_REVIEW,
+                reason=f"{reason}; {unclassified} document(s) could not be classified",
+                missing_documents=missing,
+                validation_timestamp=datetime.now(UTC).isoformat(),
+            )
+        return ValidationReport(
+            status=DocStatus.REJECTED,
+            reason=reason,
+            missing_documents=missing,
+            validation_timestamp=datetime.now(UTC).isoformat(),
+        )
+
+    parsed = [(doc, json.loads(doc.data)) for doc in docs]
+    discrepancies: list[ValidationIssue] = []
+    admission_dates: list[date] = []
+
+    for doc, data in parsed:
+        if doc.doc_type != DocumentType.DISCHARGE_SUMMARY:
+            continue
+        admitted = _parse_date(data.get("admission_date"))
+        discharged = _parse_date(data.get("discharge_date"))
+        if admitted:
+            admission_dates.append(admitted)
+        if admitted and discharged and discharged < admitted:
+            discrepancies.append(
+                ValidationIssue(
+                    severity=Severity.HIGH,
+                    message=f"Discharge date {discharged} is before admission date {admitted}",
+                    field="discharge_date",
+                    doc_type=doc.doc_type,
+                )
+            )
+
+    if admission_dates:
+        admitted = min(admission_dates)
+        for doc, data in parsed:
+            billed = _parse_date(data.get("bill_date")) if doc.doc_type in BILL_DOC_TYPES else None
+            if billed and billed < admitted:
+                discrepancies.append(
+                    ValidationIssue(
+                        severity=Severity.MEDIUM,
+                        message=f"Bill date {billed} is before admission date {admitted}",
+                        field="bill_date",
+                        doc_type=doc.doc_type,
+                    )
+                )
+
+    if not discrepancies:
+        return None
+
+    return ValidationReport(
+        status=DocStatus.MANUAL_REVIEW,
+        reason="Date discrepancies between documents",
+        discrepancies=discrepancies,
+        validation_timestamp=datetime.now(UTC).isoformat(),
+    )
+
 
 @traceable(
     name="claim_validation_agent",
     tags=["dimension:language", "node:claim_validation"],
     metadata={"dimension": "language", "component": "ClaimValidationNode"},
+    process_inputs=summarize_node_inputs,
 )
 async def claim_validation_node(state: ClaimState, config: RunnableConfig) -> dict[str, Any]:
     """
@@ -34,6 +138,8 @@ async def claim_validation_node(state: ClaimState, config: RunnableConfig) -> di
     plausible dates, and suspected fraud.
 
     - Accepts all ExtractedDocument objects for the current claim (state.extracted_documents).
+    - Decides claims with missing mandatory documents or impossible dates without the LLM
+      (manual review instead of rejection when a document could not be classified).
     - Evaluates the claim with the LLM using structured output (ValidationReport schema).
     - Captures the validation status, details any discrepancies, and lists missing documents.
     - Handles exceptions and triggers a manual review status in case of errors.
@@ -45,24 +151,31 @@ async def claim_validation_node(state: ClaimState, config: RunnableConfig) -> di
     Returns:
         Dict containing the generated ValidationReport object
     """
-    context_data: list[dict[str, Any]] = []
-    for doc in state.extracted_documents:
-        context_data.append(
-            {"file_name": doc.filename, "file_type": doc.doc_type, "extracted_data": doc.data}
-        )
-
     log.info("⚖️  Validating Claim consistency...")
 
-    llm = get_default_llm(temperature=0.0)
-    structured_llm = llm.with_structured_output(ValidationReport)
+    precheck = _precheck_claim(state["extracted_documents"], state["classified_docs"])
+    if precheck is not None:
+        log.info(f"🔮 Final Decision: {precheck.status.value} (rule-based: {precheck.reason})")
+        return {"validation_report": precheck}
+
+    # `doc.data` is already JSON, so splice the fragments in rather than re-parsing them
+    context_data = ",\n".join(
+        f'{{"file_name": {json.dumps(doc.filename)}, "file_type": "{doc.doc_type.value}", '
+        f'"extracted_data": {doc.data}}}'
+        for doc in state["extracted_documents"]
+    )
+
+    structured_llm = get_structured_llm(ValidationReport)
 
     try:
-        response: ValidationReport = await structured_llm.ainvoke(
+        response: ValidationReport = await cached_structured_invoke(
+            structured_llm,
+            ValidationReport,
             [
-                SystemMessage(content=CLAIM_VALIDATION_SYSTEM_PROMPT),
-                HumanMessage(content=f"Extracted Documents:\n{context_data}"),
+                CLAIM_VALIDATION_SYSTEM_MESSAGE,
+                HumanMessage(content=f"Extracted Documents:\n[{context_data}]"),
             ],
-            config=config,
+            config,
         )
 
         claim_result = ValidationReport(
@@ -5,21 +5,34 @@ Determines document types from raw text using LLM
 
 from typing import Any
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 from langsmith import traceable
 
-from src.ai.graph.state import ClaimState, ClassificationSchema, ClassifiedDocument
+from src.ai.cache import cached_structured_batch
+from src.ai.fast_classify import PREFILTER_CONFIDENCE, fast_classify
+from src.ai.graph.state import (
+    ClaimState,
+    ClassificationSchema,
+    ClassifiedDocument,
+    DocumentInput,
+)
 from src.ai.prompts import CLASSIFICATION_SYSTEM_PROMPT
-from src.core.llm import get_default_llm
+from src.ai.tracing import summarize_node_inputs
+from src.ai.truncate import truncate_to_tokens
+from src.core.config import settings
+from src.core.llm import build_system_message, get_structured_llm
 from src.schema.enum import DocumentType
 from src.utils.logger import log
 
+CLASSIFICATION_SYSTEM_MESSAGE = build_system_message(CLASSIFICATION_SYSTEM_PROMPT)
+
 
 @traceable(
     name="classification_agent",
     tags=["dimension:language", "node:document_classification"],
     metadata={"dimension": "language", "component": "DocumentClassificationNode"},
+    process_inputs=summarize_node_inputs,
 )
 async def classification_node(state: ClaimState, config: RunnableConfig) -> dict[str, Any]:
     """
@@ -35,12 +48,13 @@ async def classification_node(state: ClaimState, config: RunnableConfig) -> dict
     Returns:
         Dict with classified_docs key containing list of classified documents
     """
-    llm = get_default_llm(temperature=0.0)
-    structured_llm = llm.with_structured_output(ClassificationSchema)
+    structured_llm = get_structured_llm(ClassificationSchema)
 
     classified_docs: list[ClassifiedDocument] = []
+    pending_docs: list[DocumentInput] = []
+    messages_list = []
 
-    for doc_input in state.inputs:
+    for doc_input in state["inputs"]:
         filename = doc_input.filename
         raw_text = doc_input.raw_text
 
@@ -52,48 +66,72 @@ async def classification_node(state: ClaimState, config: RunnableConfig) -> dict
                     doc_type=DocumentType.OTHER,
                     reasoning="Insufficient text content extracted.",
                     confidence=0.0,
-                    raw_text=raw_text,
                 )
             )
             continue
 
-        try:
-            truncated_text = raw_text[:10000]
-            response: ClassificationSchema = await structured_llm.ainvoke(
-                [
-                    SystemMessage(content=CLASSIFICATION_SYSTEM_PROMPT),
-                    HumanMessage(
-                        content=f"Document Filename: {filename}\n\nDocument Content:\n{truncated_text}"
-                    ),
-                ],
-                config=config,
-            )
-
-            log.info(
-                f"🧾 Classified {filename} -> {response.doc_type.value} "
-                f"(confidence: {response.confidence:.2%})"
-            )
-
+        hit = (
+            fast_classify(filename, raw_text) if settings.CLASSIFICATION_PREFILTER_ENABLED else None
+        )
+        if hit is not None:
+            doc_type, reasoning = hit
+            log.info(f"🧾 Classified {filename} -> {doc_type.value} (keyword prefilter)")
             classified_docs.append(
                 ClassifiedDocument(
                     filename=filename,
-                    doc_type=response.doc_type,
-                    reasoning=response.reasoning,
-                    confidence=response.confidence,
-                    raw_text=raw_text,
+                    doc_type=doc_type,
+                    reasoning=reasoning,
+                    confidence=PREFILTER_CONFIDENCE,
                 )
             )
+            continue
+
+        truncated_text = truncate_to_tokens(raw_text, 3000)
+        pending_docs.append(doc_input)
+        messages_list.append(
+            [
+                CLASSIFICATION_SYSTEM_MESSAGE,
+                HumanMessage(
+                    content=(f"Document Content:\n{truncated_text}\n\n[meta] filename: {filename}")
+                ),
+            ]
+        )
+
+    if not messages_list:
+        return {"classified_docs": classified_docs}
+
+    # One batched call for all documents; failures are returned per-document, not raised
+    responses: list[ClassificationSchema | Exception] = await cached_structured_batch(
+        structured_llm, ClassificationSchema, messages_list, config
+    )
+
+    for doc_input, response in zip(pending_docs, responses, strict=True):
+        filename = doc_input.filename
 
-        except Exception as e:
-            log.error(f"❌ Error classifying {filename}: {e}")
+        if isinstance(response, Exception):
+            log.error(f"❌ Error classifying {filename}: {response}")
             classified_docs.append(
                 ClassifiedDocument(
                     filename=filename,
                     doc_type=DocumentType.OTHER,
-                    reasoning=f"Classification failed: {e!s}",
+                    reasoning=f"Classification failed: {response!s}",
                     confidence=0.0,
-                    raw_text=raw_text,
                 )
             )
+            continue
+
+        log.info(
+            f"🧾 Classified {filename} -> {response.doc_type.value} "
+            f"(confidence: {response.confidence:.2%})"
+        )
+
+        classified_docs.append(
+            ClassifiedDocument(
+                filename=filename,
+                doc_type=response.doc_type,
+                reasoning=response.reasoning,
+                confidence=response.confidence,
+            )
+        )
 
     return {"classified_docs": classified_docs}
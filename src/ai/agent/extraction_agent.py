@@ -0,0 +1,217 @@
+"""
+Extraction Agent Node
+Extracts structured data from every classified document in a single node:
+financial data from bills, clinical data from discharge summaries, and
+policy holder information from insurance ID cards
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any, NamedTuple
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableConfig
+from langsmith import traceable
+from pydantic import BaseModel
+
+from src.ai.cache import cached_structured_batch
+from src.ai.graph.state import (
+    BillSchema,
+    ClaimState,
+    ClassifiedDocument,
+    DischargeSummarySchema,
+    ExtractedDocument,
+    IDCardSchema,
+    get_raw_text,
+)
+from src.ai.prompts import (
+    BILL_EXTRACTION_SYSTEM_PROMPT,
+    DISCHARGE_EXTRACTION_SYSTEM_PROMPT,
+    ID_CARD_EXTRACTION_SYSTEM_PROMPT,
+)
+from src.ai.tracing import summarize_node_inputs
+from src.ai.truncate import truncate_to_tokens
+from src.core.llm import build_system_message, get_structured_llm
+from src.schema.enum import DocumentType
+from src.utils.logger import log
+
+# Static prefixes shared by every call so provider-side prompt caching can reuse them
+BILL_SYSTEM_MESSAGE = build_system_message(BILL_EXTRACTION_SYSTEM_PROMPT)
+DISCHARGE_SYSTEM_MESSAGE = build_system_message(DISCHARGE_EXTRACTION_SYSTEM_PROMPT)
+ID_CARD_SYSTEM_MESSAGE = build_system_message(ID_CARD_EXTRACTION_SYSTEM_PROMPT)
+
+
+def _bill_summary(response: BillSchema) -> str:
+    amount_str = (
+        f"{response.total_amount} {response.currency}"
+        if response.total_amount
+        else "amount not found"
+    )
+    return (
+        f"Invoice: {response.invoice_number or 'N/A'} | "
+        f"Amount: {amount_str} | "
+        f"Hospital: {response.hospital_name or 'N/A'}"
+    )
+
+
+def _discharge_summary(response: DischargeSummarySchema) -> str:
+    return (
+        f"Patient: {response.patient_name or 'N/A'} | "
+        f"Admission: {response.admission_date or 'N/A'} | "
+        f"Discharge: {response.discharge_date or 'N/A'} | "
+        f"Diagnosis: {response.diagnosis or 'N/A'}"
+    )
+
+
+def _id_card_summary(response: IDCardSchema) -> str:
+    return (
+        f"Name: {response.full_name or 'N/A'} | "
+        f"Policy #: {response.policy_number or 'N/A'} | "
+        f"DOB: {response.date_of_birth or 'N/A'}"
+    )
+
+
+class ExtractionRoute(NamedTuple):
+    """How documents of one type are extracted."""
+
+    schema: type[BaseModel]
+    system_message: SystemMessage
+    max_tokens: int  # Token budget for the document text
+    label: str  # Document type as named in the prompt
+    summarize: Callable[[Any], str]  # One-line log summary of a successful extraction
+
+
+_ROUTE: dict[DocumentType, ExtractionRoute] = {
+    DocumentType.BILL: ExtractionRoute(
+        BillSchema, BILL_SYSTEM_MESSAGE, 2500, DocumentType.BILL.value, _bill_summary
+    ),
+    DocumentType.PHARMACY_BILL: ExtractionRoute(
+        BillSchema, BILL_SYSTEM_MESSAGE, 2500, DocumentType.PHARMACY_BILL.value, _bill_summary
+    ),
+    DocumentType.DISCHARGE_SUMMARY: ExtractionRoute(
+        DischargeSummarySchema,
+        DISCHARGE_SYSTEM_MESSAGE,
+        4500,
+        "Discharge Summary",
+        _discharge_summary,
+    ),
+    DocumentType.ID_CARD: ExtractionRoute(
+        IDCardSchema, ID_CARD_SYSTEM_MESSAGE, 1500, "Insurance ID Card", _id_card_summary
+    ),
+}
+
+# Document types the extraction node handles; everything else skips extraction
+EXTRACTABLE_DOC_TYPES = frozenset(_ROUTE)
+
+
+async def _extract_group(
+    state: ClaimState,
+    schema: type[BaseModel],
+    docs: list[ClassifiedDocument],
+    config: RunnableConfig,
+) -> list[BaseModel | Exception]:
+    """Extract all documents sharing one output schema in a single batched call."""
+    messages_list = []
+    semantic_keys: list[tuple[str, str]] = []
+    for doc in docs:
+        route = _ROUTE[doc.doc_type]
+        doc_type = doc.doc_type.value
+        log.info(f"🔎 Extracting {doc_type} data from: {doc.filename}")
+        truncated_text = truncate_to_tokens(get_raw_text(state, doc.filename), route.max_tokens)
+        semantic_keys.append((doc_type, truncated_text))
+        messages_list.append(
+            [
+                route.system_message,
+                HumanMessage(
+                    content=(
+                        f"Document Type: {route.label}\n\n"
+                        f"Document Content:\n{truncated_text}\n\n"
+                        f"[meta] filename: {doc.filename}"
+                    )
+                ),
+            ]
+        )
+
+    return await cached_structured_batch(
+        get_structured_llm(schema), schema, messages_list, config, semantic_keys
+    )
+
+
+@traceable(
+    name="extraction_agent",
+    tags=["dimension:language", "node:document_extraction"],
+    metadata={"dimension": "language", "component": "DocumentExtractionNode"},
+    process_inputs=summarize_node_inputs,
+)
+async def extraction_node(state: ClaimState, config: RunnableConfig) -> dict[str, Any]:
+    """
+    LangGraph Node: Extraction Agent.
+
+    Routes every classified bill, pharmacy bill, discharge summary, and ID
+    card to its extraction schema and prompt. Documents sharing a schema are
+    sent in one batched call, and the batches for different schemas run
+    concurrently.
+
+    Args:
+        state: Current claim processing state with classified documents
+        config: LangGraph runtime configuration for tracing
+
+    Returns:
+        Dict with extracted_documents key containing list of ExtractedDocument objects
+    """
+    groups: dict[type[BaseModel], list[ClassifiedDocument]] = {}
+    for doc in state["classified_docs"]:
+        route = _ROUTE.get(doc.doc_type)
+        if route is not None:
+            groups.setdefault(route.schema, []).append(doc)
+
+    if not groups:
+        log.warning("⚠️ No extractable documents found in this claim.")
+        return {"extracted_documents": []}
+
+    # Failures are returned per-document, not raised
+    group_responses = await asyncio.gather(
+        *[_extract_group(state, schema, docs, config) for schema, docs in groups.items()]
+    )
+
+    # All batches complete together, so every document shares one timestamp
+    batch_ts = datetime.now(UTC).isoformat()
+    extracted_results: list[ExtractedDocument] = []
+
+    for docs, responses in zip(groups.values(), group_responses, strict=True):
+        for doc, response in zip(docs, responses, strict=True):
+            filename = doc.filename
+            doc_type = doc.doc_type.value
+
+            if isinstance(response, Exception):
+                log.error(f"❌ {doc_type} extraction failed for {filename}: {response}")
+                extracted_results.append(
+                    ExtractedDocument(
+                        filename=filename,
+                        doc_type=doc.doc_type,
+                        data=json.dumps(
+                            {
+                                "extraction_error": str(response),
+                                "error_type": type(response).__name__,
+                            }
+                        ),
+                        extraction_timestamp=batch_ts,
+                    )
+                )
+                continue
+
+            extracted_results.append(
+                ExtractedDocument(
+                    filename=filename,
+                    doc_type=doc.doc_type,
+                    data=response.model_dump_json(exclude_none=True),
+                    extraction_timestamp=batch_ts,
+                )
+            )
+            log.info(
+                f"✅ Extracted {doc_type}: {filename} | {_ROUTE[doc.doc_type].summarize(response)}"
+            )
+
+    return {"extracted_documents": extracted_results}
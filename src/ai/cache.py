@@ -0,0 +1,263 @@
+"""
+LLM Response Cache
+Caches structured-output LLM responses keyed on the exact prompt content, so
+re-processing an identical document skips the model call entirely.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Protocol
+
+import numpy as np
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+from pydantic import BaseModel
+
+from src.ai.semantic_cache import numeric_fingerprint, semantic_cache
+from src.core import redis as redis_core
+from src.core.config import settings
+from src.core.llm import default_model_id
+from src.utils.logger import log
+
+CACHE_KEY_PREFIX = "surecheck:llm"
+
+# Exact-cache hit/miss counts per schema name, for observability
+cache_hits: Counter[str] = Counter()
+cache_misses: Counter[str] = Counter()
+
+
+class CacheBackend(Protocol):
+    """Minimal async key/value store used by the LLM response cache."""
+
+    async def get(self, key: str) -> str | None: ...
+
+    async def set(self, key: str, value: str, ttl: int) -> None: ...
+
+
+class MemoryCacheBackend:
+    """
+    In-process LRU cache with per-entry expiry.
+
+    Used when Redis is unavailable (e.g. local scripts). Entries are evicted
+    least-recently-used once `max_items` is reached.
+    """
+
+    def __init__(self, max_items: int) -> None:
+        self.max_items = max_items
+        self._store: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def get(self, key: str) -> str | None:
+        entry = self._store.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._store[key]
+            return None
+
+        self._store.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        self._store[key] = (time.monotonic() + ttl, value)
+        self._store.move_to_end(key)
+        while len(self._store) > self.max_items:
+            self._store.popitem(last=False)
+
+
+class RedisCacheBackend:
+    """Redis-backed cache shared across workers, using the app's global Redis client."""
+
+    async def get(self, key: str) -> str | None:
+        if redis_core.redis_client is None:
+            return None
+        value: str | None = await redis_core.redis_client.get(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: int) -> None:
+        if redis_core.redis_client is None:
+            return
+        await redis_core.redis_client.set(key, value, ex=ttl)
+
+
+_memory_backend = MemoryCacheBackend(max_items=settings.LLM_CACHE_MAX_ITEMS)
+_redis_backend = RedisCacheBackend()
+
+
+def get_cache_backend() -> CacheBackend:
+    """
+    Returns the Redis backend once Redis is initialized, otherwise the in-memory fallback.
+    """
+    if redis_core.redis_client is not None:
+        return _redis_backend
+    return _memory_backend
+
+
+@lru_cache(maxsize=32)
+def schema_fingerprint(schema: type[BaseModel]) -> str:
+    """Short hash of the JSON schema, so changing an output model invalidates its entries."""
+    spec = json.dumps(schema.model_json_schema(), sort_keys=True)
+    return hashlib.blake2b(spec.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def build_cache_key(
+    schema: type[BaseModel], messages: Sequence[BaseMessage], model_id: str | None = None
+) -> str:
+    """
+    Build a deterministic cache key from the model, output schema and prompt messages.
+
+    Args:
+        schema: Pydantic model used for structured output
+        messages: Exact messages sent to the LLM (system prompt + document text)
+        model_id: `provider:model:temperature` of the LLM (default: `default_model_id()`)
+
+    Returns:
+        Key namespaced by model, schema name and schema fingerprint, ending in a BLAKE2b digest
+    """
+    payload = json.dumps([m.content for m in messages], ensure_ascii=False)
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=32).hexdigest()
+    model_id = model_id or default_model_id()
+    return f"{CACHE_KEY_PREFIX}:{model_id}:{schema.__name__}:{schema_fingerprint(schema)}:{digest}"
+
+
+async def _cache_get[T: BaseModel](schema: type[T], key: str) -> T | None:
+    try:
+        cached = await get_cache_backend().get(key)
+        hit = schema.model_validate_json(cached) if cached else None
+    except Exception as e:
+        log.warning(f"⚠️ LLM cache read failed ({schema.__name__}): {e}")
+        hit = None
+
+    counter = cache_misses if hit is None else cache_hits
+    counter[schema.__name__] += 1
+    return hit
+
+
+async def _cache_set(key: str, response: BaseModel) -> None:
+    try:
+        await get_cache_backend().set(key, response.model_dump_json(), ttl=settings.LLM_CACHE_TTL)
+    except Exception as e:
+        log.warning(f"⚠️ LLM cache write failed ({type(response).__name__}): {e}")
+
+
+def _ensure_parsed[T: BaseModel](schema: type[T], response: Any) -> T | Exception:
+    """Structured output yields None when the model skips the tool call; surface it as an error."""
+    if response is None:
+        return ValueError(f"LLM returned no structured output for {schema.__name__}")
+    return response  # type: ignore[no-any-return]
+
+
+async def cached_structured_invoke[T: BaseModel](
+    structured_llm: Runnable[Any, Any],
+    schema: type[T],
+    messages: list[BaseMessage],
+    config: RunnableConfig | None = None,
+) -> T:
+    """
+    Invoke a structured-output LLM, serving identical prompts from the cache.
+
+    Args:
+        structured_llm: Runnable from `get_structured_llm(schema)` (default LLM, temperature 0)
+        schema: Pydantic model the runnable returns
+        messages: Prompt messages
+        config: LangGraph runtime configuration for tracing
+
+    Returns:
+        Parsed schema instance (cached or fresh)
+    """
+    if not settings.LLM_CACHE_ENABLED:
+        response: T = await structured_llm.ainvoke(messages, config=config)
+        return response
+
+    key = build_cache_key(schema, messages)
+    cached = await _cache_get(schema, key)
+    if cached is not None:
+        log.debug(f"♻️ LLM cache hit for {schema.__name__}")
+        return cached
+
+    response = await structured_llm.ainvoke(messages, config=config)
+    if isinstance(response, BaseModel):
+        await _cache_set(key, response)
+    return response
+
+
+async def cached_structured_batch[T: BaseModel](
+    structured_llm: Runnable[Any, Any],
+    schema: type[T],
+    messages_list: list[list[BaseMessage]],
+    config: RunnableConfig | None = None,
+    semantic_keys: list[tuple[str, str]] | None = None,
+) -> list[T | Exception]:
+    """
+    Batched variant of `cached_structured_invoke`.
+
+    Cache hits are served directly; only the misses are sent to the LLM in a
+    single `abatch` call. Like `abatch(..., return_exceptions=True)`, failures
+    are returned in place rather than raised.
+
+    Args:
+        structured_llm: Runnable from `get_structured_llm(schema)` (default LLM, temperature 0)
+        schema: Pydantic model the runnable returns
+        messages_list: One prompt (list of messages) per document
+        config: LangGraph runtime configuration for tracing
+        semantic_keys: Optional `(namespace, document_text)` per prompt. When given and
+            SEMANTIC_CACHE_ENABLED is set, exact-cache misses are also looked up by
+            embedding similarity before calling the LLM.
+
+    Returns:
+        One schema instance or Exception per prompt, in input order
+    """
+    results: dict[int, T | Exception] = {}
+    keys = [build_cache_key(schema, messages) for messages in messages_list]
+
+    if settings.LLM_CACHE_ENABLED:
+        cached = await asyncio.gather(*[_cache_get(schema, key) for key in keys])
+        results = {i: hit for i, hit in enumerate(cached) if hit is not None}
+        if results:
+            log.debug(f"♻️ LLM cache hits for {schema.__name__}: {len(results)}/{len(keys)}")
+
+    miss_idx = [i for i in range(len(keys)) if i not in results]
+
+    vectors: dict[int, np.ndarray] = {}
+    fingerprints: dict[int, str] = {}
+    if miss_idx and semantic_keys and settings.SEMANTIC_CACHE_ENABLED:
+        fingerprints = {i: numeric_fingerprint(semantic_keys[i][1]) for i in miss_idx}
+        try:
+            embedded = await semantic_cache.embed([semantic_keys[i][1] for i in miss_idx])
+            vectors = dict(zip(miss_idx, embedded, strict=True))
+        except Exception as e:
+            log.warning(f"⚠️ Semantic cache embedding failed ({schema.__name__}): {e}")
+
+        for i, vector in vectors.items():
+            try:
+                hit = semantic_cache.lookup(schema, semantic_keys[i][0], vector, fingerprints[i])
+            except Exception as e:
+                log.warning(f"⚠️ Semantic cache lookup failed ({schema.__name__}): {e}")
+                continue
+            if hit is not None:
+                results[i] = hit
+        miss_idx = [i for i in miss_idx if i not in results]
+
+    if miss_idx:
+        fresh = await structured_llm.abatch(
+            [messages_list[i] for i in miss_idx], config=config, return_exceptions=True
+        )
+        for i, response in zip(miss_idx, fresh, strict=True):
+            results[i] = _ensure_parsed(schema, response)
+            if not isinstance(response, BaseModel):
+                continue
+            if settings.LLM_CACHE_ENABLED:
+                await _cache_set(keys[i], response)
+            if semantic_keys and i in vectors:
+                try:
+                    semantic_cache.store(semantic_keys[i][0], vectors[i], fingerprints[i], response)
+                except Exception as e:
+                    log.warning(f"⚠️ Semantic cache store failed ({schema.__name__}): {e}")
+
+    return [results[i] for i in range(len(keys))]
@@ -0,0 +1,109 @@
+"""
+Keyword Classification Prefilter
+Classifies unambiguous documents from filename and text keywords, so only the
+uncertain ones are sent to the classification LLM.
+"""
+
+import re
+from collections import defaultdict
+
+from src.schema.enum import DocumentType
+
+# Confidence reported for prefilter hits
+PREFILTER_CONFIDENCE = 0.95
+
+# Only the head of the document is scanned; headers carry the identifying labels
+_SCAN_CHARS = 8000
+
+# The winning type needs this many points (distinct keywords, +1 for a filename match)...
+_MIN_SCORE = 2
+# ...and this lead over the runner-up; anything closer is left to the LLM
+_MIN_MARGIN = 2
+
+_FILENAME_PATTERNS: dict[DocumentType, re.Pattern[str]] = {
+    DocumentType.BILL: re.compile(r"\b(?:invoice|bill|receipt)s?\b"),
+    DocumentType.PHARMACY_BILL: re.compile(r"\b(?:pharmacy|pharma|chemist|medicines?)\b"),
+    DocumentType.DISCHARGE_SUMMARY: re.compile(r"\bdischarge\b"),
+    DocumentType.ID_CARD: re.compile(r"\b(?:id|e ?card|(?:health|insurance|policy) card)\b"),
+    DocumentType.CLAIM_FORM: re.compile(r"\bclaim ?form\b"),
+}
+
+# Keyword alternatives per type; these mirror the cues listed in the classification prompt
+_TEXT_SIGNALS: dict[DocumentType, str] = {
+    DocumentType.BILL: (
+        r"invoice\s*(?:no|number|#)|tax\s*invoice|bill\s*(?:no|number|date)"
+        r"|total\s*amount(?:\s*due)?|grand\s*total|amount\s*payable|net\s*payable|gst(?:in)?"
+    ),
+    DocumentType.PHARMACY_BILL: (
+        r"pharmacy|chemist|drug\s*lic(?:ence|ense)?|batch\s*no|exp(?:iry)?\s*date|mrp"
+    ),
+    DocumentType.DISCHARGE_SUMMARY: (
+        r"discharge\s*summary|date\s*of\s*(?:admission|discharge)|admission\s*date"
+        r"|discharge\s*date|course\s*in\s*(?:the\s*)?hospital|final\s*diagnosis"
+        r"|history\s*of\s*present\s*illness|discharge\s*(?:advice|instructions)"
+    ),
+    DocumentType.ID_CARD: (
+        r"policy\s*(?:no|number|id)|member\s*id|insured\s*(?:name|id)|card\s*no"
+        r"|valid\s*(?:till|upto|up\s*to|from)|health\s*card|tpa"
+    ),
+    DocumentType.CLAIM_FORM: (
+        r"claim\s*form|cms-?1500|declaration\s*by\s*(?:the\s*)?(?:insured|hospital)"
+    ),
+}
+
+# One case-insensitive pass over the text; the named group tags each match with its type
+_KEYWORD_RE = re.compile(
+    "|".join(rf"\b(?P<{doc_type.value}>{alts})\b" for doc_type, alts in _TEXT_SIGNALS.items()),
+    re.IGNORECASE,
+)
+
+
+def _filename_hits(filename: str) -> set[DocumentType]:
+    stem = re.sub(r"[^a-z]+", " ", filename.rsplit(".", 1)[0].lower())
+    hits = {doc_type for doc_type, pattern in _FILENAME_PATTERNS.items() if pattern.search(stem)}
+    # "pharmacy_bill.pdf" names a pharmacy bill, not a hospital bill
+    if DocumentType.PHARMACY_BILL in hits:
+        hits.discard(DocumentType.BILL)
+    return hits
+
+
+def fast_classify(filename: str, text: str) -> tuple[DocumentType, str] | None:
+    """
+    Classify a document from keywords alone, when one type clearly dominates.
+
+    Each type scores one point per distinct keyword found in a single regex pass
+    over the document head, plus one if the filename names it. The top type wins
+    only with at least `_MIN_SCORE` points, at least one of them from the text,
+    and a `_MIN_MARGIN` lead over the runner-up.
+
+    Args:
+        filename: Original upload filename
+        text: Extracted document text
+
+    Returns:
+        (document type, reasoning) on a confident match, else None
+    """
+    signals: defaultdict[DocumentType, set[str]] = defaultdict(set)
+    for match in _KEYWORD_RE.finditer(text, 0, _SCAN_CHARS):
+        doc_type = DocumentType(match.lastgroup)
+        signals[doc_type].add(" ".join(match.group().lower().split()))
+
+    if not signals:
+        return None
+
+    name_hits = _filename_hits(filename)
+    scores = {
+        doc_type: len(signals.get(doc_type, ())) + (doc_type in name_hits)
+        for doc_type in signals.keys() | name_hits
+    }
+    ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    best_type, best = ranked[0]
+    runner_up = ranked[1][1] if len(ranked) > 1 else 0
+
+    if best < _MIN_SCORE or best - runner_up < _MIN_MARGIN or not signals.get(best_type):
+        return None
+
+    return best_type, (
+        f"Keyword prefilter ({best} vs {runner_up}): {', '.join(sorted(signals[best_type]))}"
+        + (" + filename" if best_type in name_hits else "")
+    )
@@ -5,7 +5,7 @@ Defines the structure of data flowing through the claim processing graph
 
 import operator
 from datetime import UTC, datetime
-from typing import Annotated, Any
+from typing import Annotated, TypedDict
 
 from pydantic import BaseModel, Field
 
@@ -73,7 +73,6 @@ class ClassifiedDocument(BaseModel):
     """Document after classification"""
 
     filename: str
-    raw_text: str
     doc_type: DocumentType
     reasoning: str
     confidence: float = Field(ge=0.0, le=1.0, description="Classification confidence score")
@@ -84,29 +83,43 @@ class ExtractedDocument(BaseModel):
 
     filename: str
     doc_type: DocumentType
-    raw_text: str
-    data: dict[str, Any]
+    data: str = Field(description="Extracted fields as JSON (schema output or extraction error)")
     extraction_timestamp: str | None = None
 
 
 # ----- The Main Graph State (Passed between nodes) -----
 
 
-class ClaimState(BaseModel):
+class ClaimState(TypedDict):
     """
     Main state object passed between LangGraph nodes.
 
     This represents the complete state of a claim as it moves through
     the processing pipeline: classification -> extraction -> validation.
+
+    A plain TypedDict, so node updates are merged without re-validating the
+    whole state; the documents inside are validated once when constructed.
     """
 
-    inputs: list[DocumentInput] = Field(default_factory=list)
-    classified_docs: list[ClassifiedDocument] = Field(default_factory=list)
-    extracted_documents: Annotated[list[ExtractedDocument], operator.add] = Field(
-        default_factory=list
-    )
-    validation_report: ValidationReport | None = None
-    claim_id: str | None = None
+    inputs: list[DocumentInput]
+    classified_docs: list[ClassifiedDocument]
+    extracted_documents: Annotated[list[ExtractedDocument], operator.add]
+    validation_report: ValidationReport | None
+
 
-    class Config:
-        arbitrary_types_allowed = True
+def get_raw_text(state: ClaimState, filename: str) -> str:
+    """
+    Look up a document's text in `state["inputs"]`.
+
+    The text is stored only on the input documents, so classified and extracted
+    documents stay small in checkpoints and traces. Filenames are unique within a
+    claim (`process_claim` numbers duplicates), so the name identifies the input.
+
+    Args:
+        state: Current claim processing state
+        filename: Filename of the input document
+
+    Returns:
+        The document's extracted text, or an empty string if it is not in the inputs
+    """
+    return next((doc.raw_text for doc in state["inputs"] if doc.filename == filename), "")
@@ -1,21 +1,29 @@
 from langgraph.graph import END, START, StateGraph
 
-from src.ai.agent.bill_agent import bill_extraction_node
 from src.ai.agent.claim_agent import claim_validation_node
 from src.ai.agent.classification_agent import classification_node
-from src.ai.agent.discharge_agent import discharge_extraction_node
-from src.ai.agent.id_agent import id_extraction_node
+from src.ai.agent.extraction_agent import EXTRACTABLE_DOC_TYPES, extraction_node
 
 from .state import ClaimState
 
+
+def route_after_classification(state: ClaimState) -> str:
+    """
+    Send the claim to the extractor only when it has documents to extract.
+
+    When no document needs extraction the claim goes straight to the validator.
+    """
+    if any(doc.doc_type in EXTRACTABLE_DOC_TYPES for doc in state["classified_docs"]):
+        return "extractor"
+    return "claim_validator"
+
+
 # 1. Initialize the Graph
 workflow = StateGraph(ClaimState)
 
 # 2. Add Nodes
 workflow.add_node("classifier", classification_node)
-workflow.add_node("bill_extractor", bill_extraction_node)
-workflow.add_node("discharge_extractor", discharge_extraction_node)
-workflow.add_node("id_extractor", id_extraction_node)
+workflow.add_node("extractor", extraction_node)
 workflow.add_node("claim_validator", claim_validation_node)
 
 # 3. Define Edges
@@ -23,18 +31,16 @@ workflow.add_node("claim_validator", claim_validation_node)
 # Start -> Classifier
 workflow.add_edge(START, "classifier")
 
-# Classifier -> Parallel Extraction
-workflow.add_edge("classifier", "bill_extractor")
-workflow.add_edge("classifier", "discharge_extractor")
-workflow.add_edge("classifier", "id_extractor")
+# Classifier -> Extractor (skipped when there is nothing to extract)
+workflow.add_conditional_edges(
+    "classifier", route_after_classification, ["extractor", "claim_validator"]
+)
 
-# Extractors -> Validator
-workflow.add_edge("bill_extractor", "claim_validator")
-workflow.add_edge("discharge_extractor", "claim_validator")
-workflow.add_edge("id_extractor", "claim_validator")
+# Extractor -> Validator
+workflow.add_edge("extractor", "claim_validator")
 
 # Validator -> End
 workflow.add_edge("claim_validator", END)
 
-# 4. Compile
-app = workflow.compile()
+# 4. Compile (no checkpointer: each claim is a stateless single run via `ainvoke`)
+app = workflow.compile(checkpointer=None)
@@ -2,7 +2,9 @@
 Central repository for all LLM prompts used in the application.
 """
 
-CLASSIFICATION_SYSTEM_PROMPT = """
+from typing import Final
+
+CLASSIFICATION_SYSTEM_PROMPT: Final = """
 You are an expert document classifier for a Medical Insurance Claims processing system.
 Your task is to analyze the provided text content of a document and classify it into exactly one of the following categories:
 
@@ -22,7 +24,7 @@ Your task is to analyze the provided text content of a document and classify it
 **Output Format:** Strict JSON matching the schema.
 """
 
-BILL_EXTRACTION_SYSTEM_PROMPT = """
+BILL_EXTRACTION_SYSTEM_PROMPT: Final = """
 You are an expert Medical Bill Extractor.
 Your goal is to extract structured financial data from the provided medical invoice or pharmacy receipt.
 
@@ -39,7 +41,7 @@ Your goal is to extract structured financial data from the provided medical invo
 **Output Format:** Strict JSON matching the schema.
 """
 
-DISCHARGE_EXTRACTION_SYSTEM_PROMPT = """
+DISCHARGE_EXTRACTION_SYSTEM_PROMPT: Final = """
 You are an expert Medical Record Analyzer.
 Your goal is to extract clinical details from a Hospital Discharge Summary.
 
@@ -60,7 +62,7 @@ Your goal is to extract clinical details from a Hospital Discharge Summary.
 **Output Format:** Strict JSON matching the schema.
 """
 
-ID_CARD_EXTRACTION_SYSTEM_PROMPT = """
+ID_CARD_EXTRACTION_SYSTEM_PROMPT: Final = """
 You are an expert Identity Verification Agent.
 Your goal is to extract policy and personal details from an Insurance ID Card or Government ID.
 
@@ -75,7 +77,7 @@ Your goal is to extract policy and personal details from an Insurance ID Card or
 **Output Format:** Strict JSON matching the schema.
 """
 
-CLAIM_VALIDATION_SYSTEM_PROMPT = """
+CLAIM_VALIDATION_SYSTEM_PROMPT: Final = """
 You are a Senior Medical Claims Adjudicator.
 Your task is to validate a set of extracted documents and make a final claim decision.
 
@@ -0,0 +1,205 @@
+"""
+Semantic (Embedding) Cache
+Reuses prior structured extractions for near-duplicate documents (re-uploads,
+OCR whitespace/header noise) by nearest-neighbour search over embeddings of
+the document text.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+import numpy as np
+from pydantic import BaseModel
+
+from src.core.config import settings
+from src.core.llm import get_default_embeddings
+from src.utils.logger import log
+
+SEMANTIC_CACHE_DIR = Path(settings.BASE_DIR) / "data" / "semantic_cache"
+
+_DIGIT_RUN = re.compile(r"\d+")
+
+
+def numeric_fingerprint(text: str) -> str:
+    """
+    Hash of every digit run in the text, in order.
+
+    Documents from the same template embed almost identically even when the
+    patient, amounts, or dates differ; requiring equal numbers keeps a
+    near-duplicate hit from returning another claim's values.
+    """
+    digits = " ".join(_DIGIT_RUN.findall(text))
+    return hashlib.blake2b(digits.encode("ascii"), digest_size=16).hexdigest()
+
+
+class _Namespace:
+    """
+    Flat inner-product index for one (schema, document type) pair.
+
+    Vectors are L2-normalised on insert, so the inner product is the cosine
+    similarity. An exact scan over a float32 matrix is the same search as a
+    FAISS `IndexFlatIP`, which is plenty for a few thousand documents.
+    """
+
+    def __init__(self) -> None:
+        self.vectors: np.ndarray | None = None
+        self.created_at: list[float] = []
+        self.fingerprints: list[str] = []
+        self.payloads: list[str] = []
+
+    def matches(self, vector: np.ndarray) -> bool:
+        """Whether `vector` has this index's width (it changes with the embedding model)."""
+        return self.vectors is None or self.vectors.shape[1] == vector.shape[0]
+
+    def search(self, vector: np.ndarray, fingerprint: str, ttl: int) -> tuple[float, str | None]:
+        if self.vectors is None or not self.payloads or not self.matches(vector):
+            return 0.0, None
+
+        scores = self.vectors @ vector
+        best = int(np.argmax(scores))
+        if self.created_at[best] + ttl < time.time() or self.fingerprints[best] != fingerprint:
+            return float(scores[best]), None
+        return float(scores[best]), self.payloads[best]
+
+    def add(self, vector: np.ndarray, fingerprint: str, payload: str, max_items: int) -> None:
+        row = vector.reshape(1, -1)
+        self.vectors = row if self.vectors is None else np.vstack([self.vectors, row])
+        self.created_at.append(time.time())
+        self.fingerprints.append(fingerprint)
+        self.payloads.append(payload)
+
+        # Drop the oldest entries once the namespace is full
+        overflow = len(self.payloads) - max_items
+        if overflow > 0:
+            self.vectors = self.vectors[overflow:]
+            self.created_at = self.created_at[overflow:]
+            self.fingerprints = self.fingerprints[overflow:]
+            self.payloads = self.payloads[overflow:]
+
+
+class SemanticCache:
+    """
+    Similarity-threshold cache of structured LLM outputs.
+
+    Entries are namespaced per schema and document type, so a bill can only
+    ever be answered from a prior bill, and a hit also requires the same
+    numbers (see `numeric_fingerprint`). Hit/miss counters are kept for
+    observability.
+
+    Attributes:
+        threshold (float): Minimum cosine similarity for a hit
+        ttl (int): Entry lifetime in seconds
+        max_items (int): Maximum entries kept per namespace
+    """
+
+    def __init__(self, threshold: float, ttl: int, max_items: int) -> None:
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_items = max_items
+        self.hits = 0
+        self.misses = 0
+        self._namespaces: dict[str, _Namespace] = {}
+
+    @staticmethod
+    def _normalise(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    async def embed(self, texts: list[str]) -> list[np.ndarray]:
+        """Embed document texts in a single provider call."""
+        embeddings = await get_default_embeddings().aembed_documents(texts)
+        return [self._normalise(embedding) for embedding in embeddings]
+
+    def lookup[T: BaseModel](
+        self, schema: type[T], namespace: str, vector: np.ndarray, fingerprint: str
+    ) -> T | None:
+        """
+        Return the cached response of the nearest prior document, if similar enough.
+
+        Args:
+            schema: Pydantic model to rehydrate the cached JSON into
+            namespace: Document type the text was classified as
+            vector: Normalised embedding of the document text
+            fingerprint: `numeric_fingerprint` of the document text
+
+        Returns:
+            Cached schema instance on a hit, else None
+        """
+        index = self._namespaces.get(f"{schema.__name__}:{namespace}")
+        score, payload = index.search(vector, fingerprint, self.ttl) if index else (0.0, None)
+
+        if payload is None or score < self.threshold:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        log.debug(f"♻️ Semantic cache hit for {schema.__name__}:{namespace} (cosine {score:.3f})")
+        return schema.model_validate_json(payload)
+
+    def store(
+        self, namespace: str, vector: np.ndarray, fingerprint: str, response: BaseModel
+    ) -> None:
+        """Insert a fresh LLM response for future near-duplicate lookups."""
+        key = f"{type(response).__name__}:{namespace}"
+        index = self._namespaces.get(key)
+        if index is None or not index.matches(vector):
+            # New namespace, or entries embedded by a different model: start over
+            index = self._namespaces[key] = _Namespace()
+        index.add(vector, fingerprint, response.model_dump_json(), self.max_items)
+
+    def save(self, directory: Path = SEMANTIC_CACHE_DIR) -> None:
+        """
+        Persist every namespace as one `.npz` file (vectors plus a JSON sidecar).
+
+        Each file is written to a temporary name and renamed into place, so the
+        workers saving at shutdown replace whole files and never mix their entries.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        for key, index in self._namespaces.items():
+            if index.vectors is None:
+                continue
+            sidecar = {
+                "created_at": index.created_at,
+                "fingerprints": index.fingerprints,
+                "payloads": index.payloads,
+            }
+            path = directory / f"{key}.npz"
+            tmp_path = directory / f".{key}.{os.getpid()}.tmp"
+            with tmp_path.open("wb") as f:
+                np.savez(f, vectors=index.vectors, sidecar=np.array(json.dumps(sidecar)))
+            os.replace(tmp_path, path)
+
+    def load(self, directory: Path = SEMANTIC_CACHE_DIR) -> None:
+        """Reload namespaces written by `save`; unreadable or inconsistent files are skipped."""
+        if not directory.exists():
+            return
+
+        for path in directory.glob("*.npz"):
+            try:
+                with np.load(path) as data:
+                    vectors = data["vectors"].astype(np.float32)
+                    sidecar = json.loads(str(data["sidecar"]))
+                index = _Namespace()
+                index.vectors = vectors
+                index.created_at = list(sidecar["created_at"])
+                index.fingerprints = list(sidecar["fingerprints"])
+                index.payloads = list(sidecar["payloads"])
+                rows = {len(index.created_at), len(index.fingerprints), len(index.payloads)}
+                if vectors.ndim != 2 or rows != {vectors.shape[0]}:
+                    raise ValueError(f"{vectors.shape} vectors for {sorted(rows)} entries")
+                self._namespaces[path.stem] = index
+            except Exception as e:
+                log.warning(f"⚠️ Skipping semantic cache file {path.name}: {e}")
+
+
+# Singleton instance for application-wide import
+semantic_cache: SemanticCache = SemanticCache(
+    threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+    ttl=settings.SEMANTIC_CACHE_TTL,
+    max_items=settings.SEMANTIC_CACHE_MAX_ITEMS,
+)
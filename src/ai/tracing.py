@@ -0,0 +1,25 @@
+"""
+LangSmith Tracing Helpers
+Keeps node traces small: the graph state carries full document text, so
+traced inputs are reduced to a per-stage summary.
+"""
+
+from typing import Any
+
+
+def summarize_node_inputs(inputs: dict[str, Any]) -> dict[str, Any]:
+    """
+    `process_inputs` hook for `@traceable` graph nodes.
+
+    Args:
+        inputs: Bound node arguments (`state`, `config`)
+
+    Returns:
+        Filenames and document types at each stage instead of the raw state
+    """
+    state = inputs.get("state") or {}
+    summary: dict[str, Any] = {"filenames": [doc.filename for doc in state.get("inputs", [])]}
+    for stage in ("classified_docs", "extracted_documents"):
+        if stage in state:
+            summary[stage] = [f"{doc.filename}:{doc.doc_type.value}" for doc in state[stage]]
+    return summary
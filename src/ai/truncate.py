@@ -0,0 +1,40 @@
+"""
+Token-aware Truncation
+Caps document text at a token budget instead of a character count, so the
+LLM input size is predictable regardless of script, tables, or whitespace.
+"""
+
+from functools import lru_cache
+
+import tiktoken
+
+# Upper bound on characters per token used to pre-slice very large texts before encoding
+_MAX_CHARS_PER_TOKEN = 8
+
+
+@lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding:
+    """Loaded lazily: the first call may need to fetch the BPE ranks file."""
+    return tiktoken.encoding_for_model("gpt-4o-mini")
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to at most `max_tokens` tokens.
+
+    Args:
+        text: Document text
+        max_tokens: Token budget
+
+    Returns:
+        The original text if it already fits, otherwise its first `max_tokens` tokens
+    """
+    # Every token spans at least one character, so short texts never need encoding
+    if len(text) <= max_tokens:
+        return text
+
+    enc = _get_encoding()
+    ids = enc.encode(text[: max_tokens * _MAX_CHARS_PER_TOKEN], disallowed_special=())
+    if len(ids) <= max_tokens and len(text) <= max_tokens * _MAX_CHARS_PER_TOKEN:
+        return text
+    return enc.decode(ids[:max_tokens])
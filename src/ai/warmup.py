@@ -0,0 +1,51 @@
+"""
+AI Warm-up
+Builds the LLM clients, structured-output runnables, and tokenizer at startup
+so the first claim doesn't pay for their construction.
+"""
+
+from src.ai.cache import schema_fingerprint
+from src.ai.graph import claim_graph_app
+from src.ai.graph.state import (
+    BillSchema,
+    ClassificationSchema,
+    DischargeSummarySchema,
+    IDCardSchema,
+)
+from src.ai.truncate import truncate_to_tokens
+from src.core.config import settings
+from src.core.llm import get_default_llm, get_structured_llm
+from src.schema.claim_dto import ValidationReport
+from src.utils.logger import log
+
+STRUCTURED_OUTPUT_SCHEMAS = (
+    ClassificationSchema,
+    BillSchema,
+    DischargeSummarySchema,
+    IDCardSchema,
+    ValidationReport,
+)
+
+
+async def warm_up_ai() -> None:
+    """
+    Pre-build everything the claim graph memoizes on first use.
+
+    Failures are logged, not raised: a missing API key should surface on the
+    first claim, not block application startup.
+    """
+    try:
+        claim_graph_app.get_graph()
+        for schema in STRUCTURED_OUTPUT_SCHEMAS:
+            get_structured_llm(schema)
+            schema_fingerprint(schema)
+
+        # Loads the BPE ranks (downloaded on first use if not cached on disk)
+        truncate_to_tokens("warm up " * 4, 1)
+
+        if settings.LLM_WARMUP_PING:
+            await get_default_llm().ainvoke("Reply with OK.")
+
+        log.info("🔥 AI components warmed up")
+    except Exception as e:
+        log.warning(f"⚠️ AI warm-up skipped: {e}")
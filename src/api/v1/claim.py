@@ -1,12 +1,14 @@
-import gc
-import uuid
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
 
 from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile, status
 from fastapi.concurrency import run_in_threadpool
-from fastapi_limiter.depends import RateLimiter
+from fastapi.responses import StreamingResponse
 
 from src.ai.graph import claim_graph_app
-from src.ai.graph.state import DocumentInput
+from src.ai.graph.state import ClassifiedDocument, DocumentInput, ExtractedDocument
 from src.schema.claim_dto import (
     ClaimDecision,
     ClaimProcessResponse,
@@ -14,6 +16,8 @@ from src.schema.claim_dto import (
     ValidationResponse,
 )
 from src.service.s3_service import s3_service
+from src.utils.ids import uuid7
+from src.utils.limiter import CachedRateLimiter
 from src.utils.logger import log
 from src.utils.pdf_loader import extract_text_from_bytes
 
@@ -23,27 +27,174 @@ router = APIRouter()
 MAX_BATCH_SIZE = 3
 MAX_FILE_SIZE_MB = 5
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
+MAX_CONCURRENT_S3_UPLOADS = 8
 
+_S3_UPLOAD_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_S3_UPLOADS)
 
-def background_s3_upload(file_bytes: bytes, filename: str, claim_id: str) -> None:
+
+async def background_s3_upload(file_bytes: bytes, filename: str, claim_id: str) -> None:
+    """
+    Uploads the given file to S3 storage after the response has been sent.
+    Non-blocking: the boto3 upload runs in the threadpool, and the number of
+    concurrent uploads is capped so bursts can't exhaust threads or memory.
+    """
+    async with _S3_UPLOAD_SEMAPHORE:
+        try:
+            s3_key = await run_in_threadpool(
+                s3_service.upload_file_sync, file_bytes, f"{claim_id}_{filename}"
+            )
+            log.info(f"✅ Background Upload Success: {filename} -> {s3_key}")
+
+            # TODO: Store the file record in PostgreSQL for later retrieval
+
+        except Exception as e:
+            log.error(f"❌ Background Upload Failed for {filename}: {e}")
+
+
+async def _extract_document(
+    file: UploadFile, claim_id: str, background_tasks: BackgroundTasks
+) -> DocumentInput | None:
     """
-    Asynchronously uploads the given file to S3 storage in a background thread.
-    Non-blocking: Ensures API responsiveness for large files.
+    Read one uploaded file, schedule its S3 backup, and extract its text.
+
+    Returns:
+        DocumentInput for the graph, or None if the file is skipped
     """
+    filename = file.filename or "unknown.pdf"
+
+    # Protection: Check Content-Length (explicit size checking)
+    if file.size and file.size > MAX_FILE_SIZE_BYTES:
+        log.warning(f"Skipping {filename}: exceeds {MAX_FILE_SIZE_MB}MB limit")
+        return None
+
     try:
-        s3_key = s3_service.upload_file_sync(file_bytes, f"{claim_id}_{filename}")
-        log.info(f"✅ Background Upload Success: {filename} -> {s3_key}")
+        file_bytes = await file.read()
+
+        if not file_bytes:
+            log.warning(f"Skipping empty file: {filename}")
+            return None
 
-        # TODO: Store the file record in PostgreSQL for later retrieval
+        # Schedule S3 Upload (Background)
+        background_tasks.add_task(background_s3_upload, file_bytes, filename, claim_id)
+
+        # Optimization: Run CPU-Heavy Extraction in ThreadPool
+        extracted_text = await run_in_threadpool(extract_text_from_bytes, file_bytes, filename)
+
+        # Memory Optimization: Drop the local reference (the background task keeps its own)
+        del file_bytes
+
+        if not extracted_text:
+            log.warning(
+                f"Could not extract text from {filename}. It might be empty, encrypted, or corrupted."
+            )
+            return None
+
+        return DocumentInput(
+            claim_id=claim_id,
+            filename=filename,
+            raw_text=extracted_text,
+            file_size=file.size,
+        )
 
     except Exception as e:
-        log.error(f"❌ Background Upload Failed for {filename}: {e}")
+        log.error(f"Error processing file {filename}: {e}")
+        return None
+
+
+def _unique_filename(filename: str, seen: set[str]) -> str:
+    """
+    Return `filename`, or a numbered variant ("scan (2).pdf") if it is already in `seen`.
+
+    Documents are matched to their text by filename throughout the graph, so every
+    input of a claim needs a distinct name.
+    """
+    if filename not in seen:
+        return filename
+    base, dot, ext = filename.rpartition(".")
+    if not dot or not base:
+        base, dot, ext = filename, "", ""
+    n = 2
+    while (candidate := f"{base} ({n}){dot}{ext}") in seen:
+        n += 1
+    return candidate
+
+
+def _workflow_config(claim_id: str, num_files: int) -> dict[str, Any]:
+    """LangGraph run config shared by the JSON and streaming responses."""
+    return {
+        "run_name": "claim_processing_workflow",
+        "tags": ["insurance", "medical-claim", "surecheck-ai"],
+        "metadata": {
+            "num_files": num_files,
+            "claim_id": claim_id,
+            "llm_model": "gemini-2.5-flash",
+        },
+    }
+
+
+def _build_response(documents: list[str], report: ValidationReport) -> ClaimProcessResponse:
+    """Wrap a validation report in the API response."""
+    return ClaimProcessResponse(
+        documents=documents,
+        validation=ValidationResponse(
+            missing_documents=report.missing_documents,
+            discrepancies=report.discrepancies,
+            validation_timestamp=report.validation_timestamp,
+        ),
+        claim_decision=ClaimDecision(status=report.status, reason=report.reason),
+    )
+
+
+def _sse(event: str, data: str) -> str:
+    """Format one Server-Sent Events frame; `data` must be a single-line JSON string."""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _claim_events(
+    workflow_input: dict[str, Any], claim_id: str, documents: list[str]
+) -> AsyncIterator[str]:
+    """
+    Run the claim graph and yield an SSE frame as each node finishes.
+
+    Emits `doc_classified` and `doc_extracted` per document, then a single
+    `validation_done` carrying the same payload as the JSON response. Failures
+    are reported as an `error` frame, since the 200 status is already sent.
+    """
+    try:
+        async for update in claim_graph_app.astream(
+            workflow_input,
+            config=_workflow_config(claim_id, len(documents)),
+            stream_mode="updates",
+        ):
+            for node_output in update.values():
+                if not node_output:
+                    continue
+                classified: list[ClassifiedDocument] = node_output.get("classified_docs", [])
+                for doc in classified:
+                    yield _sse("doc_classified", doc.model_dump_json())
+
+                extracted: list[ExtractedDocument] = node_output.get("extracted_documents", [])
+                for doc in extracted:
+                    # `data` is stored as a JSON string; send it as an object, not re-encoded
+                    payload = doc.model_dump(mode="json", exclude={"data"})
+                    payload["data"] = json.loads(doc.data)
+                    yield _sse("doc_extracted", json.dumps(payload))
+
+                report: ValidationReport | None = node_output.get("validation_report")
+                if report is not None:
+                    yield _sse(
+                        "validation_done", _build_response(documents, report).model_dump_json()
+                    )
+
+    except Exception as e:
+        log.error(f"AI Workflow Failed (stream): {e}")
+        yield _sse("error", json.dumps({"detail": f"AI processing failed: {e!s}"}))
 
 
 @router.post(
     "/process-claim",
     status_code=status.HTTP_200_OK,
-    dependencies=[Depends(RateLimiter(times=3, seconds=60))],
+    dependencies=[Depends(CachedRateLimiter(times=3, seconds=60))],
     response_model=ClaimProcessResponse,
     summary="Process Claim PDFs for AI Extraction & Validation",
     responses={
@@ -68,7 +219,8 @@ def background_s3_upload(file_bytes: bytes, filename: str, claim_id: str) -> Non
 async def process_claim(
     background_tasks: BackgroundTasks,
     files: list[UploadFile] = File(...),  # noqa: B008
-) -> ClaimProcessResponse:
+    stream: bool = False,
+) -> ClaimProcessResponse | StreamingResponse:
     """
     This endpoint allows you to submit one or more PDF files (e.g., bills, ID cards, discharge summaries)
     as part of a single insurance claim process.
@@ -80,6 +232,10 @@ async def process_claim(
     - Returns the final validation report, extracted structured data, and a list of successfully
     processed files.
 
+    **Streaming:**
+    - With `?stream=true` the response is a `text/event-stream` of `doc_classified`,
+    `doc_extracted`, and `validation_done` events, sent as each stage finishes.
+
     **Resource Protections:**
     - Maximum file size: 5MB per file; excessively large uploads are skipped (not errored).
     - All files are uploaded in the background to S3 for safekeeping.
@@ -91,56 +247,25 @@ async def process_claim(
     - `HTTP 422:` If no files yielded valid extractable text.
     - `HTTP 500:` Internal server errors.
     """
-    claim_id = str(uuid.uuid4())
+    claim_id = str(uuid7())
     graph_inputs: list[DocumentInput] = []
     uploaded_files_metadata: list[str] = []
 
     log.info(f"🚀 Processing Claim {claim_id} with {len(files)} files...")
 
-    for file in files:
-        filename = file.filename or "unknown.pdf"
-
-        # Protection: Check Content-Length (explicit size checking)
-        if file.size and file.size > MAX_FILE_SIZE_BYTES:
-            log.warning(f"Skipping {filename}: exceeds {MAX_FILE_SIZE_MB}MB limit")
-            continue
-
-        try:
-            file_bytes = await file.read()
-
-            if not file_bytes:
-                log.warning(f"Skipping empty file: {filename}")
-                continue
-
-            # Schedule S3 Upload (Background)
-            background_tasks.add_task(background_s3_upload, file_bytes, filename, claim_id)
-
-            # Optimization: Run CPU-Heavy Extraction in ThreadPool
-            extracted_text = await run_in_threadpool(extract_text_from_bytes, file_bytes, filename)
-
-            # Memory Optimization: Explicitly delete bytes reference
-            del file_bytes
-            gc.collect()
-
-            if not extracted_text:
-                log.warning(
-                    f"Could not extract text from {filename}. It might be empty, encrypted, or corrupted."
-                )
-                continue
-
-            graph_inputs.append(
-                DocumentInput(
-                    claim_id=claim_id,
-                    filename=filename,
-                    raw_text=extracted_text,
-                    file_size=file.size,
-                ),
-            )
-            uploaded_files_metadata.append(filename)
-
-        except Exception as e:
-            log.error(f"Error processing file {filename}: {e}")
-            continue
+    # Read and upload every file concurrently. PDF parsing is not parallel: pdf_loader runs
+    # PyMuPDF under one lock per worker process, shared with every other request, so only
+    # the OCR waits overlap. Results keep the upload order.
+    results = await asyncio.gather(
+        *[_extract_document(file, claim_id, background_tasks) for file in files]
+    )
+    seen_filenames: set[str] = set()
+    for document in results:
+        if document is not None:
+            document.filename = _unique_filename(document.filename, seen_filenames)
+            seen_filenames.add(document.filename)
+            graph_inputs.append(document)
+            uploaded_files_metadata.append(document.filename)
 
     if not graph_inputs:
         raise HTTPException(
@@ -151,32 +276,21 @@ async def process_claim(
     # 5. Run AI Graph (Batch)
     workflow_input = {"inputs": graph_inputs}
 
+    if stream:
+        return StreamingResponse(
+            _claim_events(workflow_input, claim_id, uploaded_files_metadata),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     try:
         result = await claim_graph_app.ainvoke(
             input=workflow_input,
-            config={
-                "run_name": "claim_processing_workflow",
-                "tags": ["insurance", "medical-claim", "surecheck-ai"],
-                "metadata": {
-                    "num_files": len(uploaded_files_metadata),
-                    "claim_id": claim_id,
-                    "llm_model": "gemini-2.5-flash",
-                },
-            },
+            config=_workflow_config(claim_id, len(uploaded_files_metadata)),
         )
         validation_report: ValidationReport = result.get("validation_report")
 
-        return ClaimProcessResponse(
-            documents=uploaded_files_metadata,
-            validation=ValidationResponse(
-                missing_documents=validation_report.missing_documents,
-                discrepancies=validation_report.discrepancies,
-                validation_timestamp=validation_report.validation_timestamp,
-            ),
-            claim_decision=ClaimDecision(
-                status=validation_report.status, reason=validation_report.reason
-            ),
-        )
+        return _build_response(uploaded_files_metadata, validation_report)
 
     except Exception as e:
         log.error(f"AI Workflow Failed: {e}")
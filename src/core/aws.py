@@ -1,4 +1,9 @@
+import boto3
+from botocore.config import Config
+from mypy_boto3_s3.client import S3Client
+
 from src.core.config import settings
+from src.utils.logger import log
 
 
 class AWSConfig:
@@ -22,3 +27,40 @@ class AWSConfig:
 
     if not all([aws_access_key, aws_secret_key, bucket_name]):
         raise ValueError("Missing required AWS credentials or bucket configuration")
+
+
+# Dedicated session: the default boto3 session is not safe to initialize from several threads
+session = boto3.session.Session(
+    aws_access_key_id=AWSConfig.aws_access_key,
+    aws_secret_access_key=AWSConfig.aws_secret_key,
+    region_name=AWSConfig.region,
+)
+
+S3_CLIENT_CONFIG = Config(
+    signature_version="s3v4",
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    # Standard mode with one retry (adaptive mode adds client-side rate-limit sleeps)
+    retries={"mode": "standard", "max_attempts": 2},
+)
+
+# Shared S3 client (thread-safe for calls), created once at import with a keep-alive pool.
+# An explicit endpoint (regional, VPC endpoint or S3-compatible store) skips endpoint resolution.
+s3_client: S3Client = session.client(
+    "s3",
+    endpoint_url=settings.S3_ENDPOINT_URL or None,
+    config=S3_CLIENT_CONFIG,
+)
+
+
+def warm_up_s3() -> None:
+    """
+    Open the first HTTPS connection to the bucket so the first upload skips the TLS handshake.
+
+    Blocking; failures (e.g. no s3:ListBucket permission) are logged, not raised.
+    """
+    try:
+        s3_client.head_bucket(Bucket=AWSConfig.bucket_name)
+        log.info("🔥 S3 connection warmed up")
+    except Exception as e:
+        log.warning(f"⚠️ S3 warm-up skipped: {e}")
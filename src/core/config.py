@@ -13,17 +13,19 @@ class Settings(BaseSettings):
 
     # Root directory and URLs
     BASE_DIR: Path = Path(__file__).resolve().parent.parent.parent
-    PUBLIC_ROUTES: set[str] = {
-        "/",
-        "/health",
-        "/metrics",
-        "/favicon.ico",
-        "/docs",
-        "/redoc",
-        "/openapi.json",
-        "/api/v1/user/register",
-        "/api/v1/user/login",
-    }
+    PUBLIC_ROUTES: frozenset[str] = frozenset(
+        {
+            "/",
+            "/health",
+            "/metrics",
+            "/favicon.ico",
+            "/docs",
+            "/redoc",
+            "/openapi.json",
+            "/api/v1/user/register",
+            "/api/v1/user/login",
+        }
+    )
     BACKEND_BASE_URL: str = "http://localhost:8000"
     FRONTEND_BASE_URL: str = "http://localhost:3000"
     CORS_ORIGINS: list[str] = ["http://localhost:3000"]
@@ -33,17 +35,40 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str
     AWS_REGION: str = "ap-south-1"
     AWS_BUCKET_NAME: str
+    S3_ENDPOINT_URL: str = ""  # Optional explicit S3 endpoint; empty uses the regional default
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"  # Default to localhost, Docker will override
+    REDIS_UNIX_SOCKET_PATH: str = ""  # Takes precedence over REDIS_URL when Redis is co-located
+    REDIS_POOL_SIZE: int = 10  # Connections per worker process, opened at startup
 
     # LLM Configs
     OPENAI_API_KEY: str = ""
     OPENAI_MODEL: str = "gpt-5"
+    OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-2.5-pro"
+    GEMINI_EMBEDDING_MODEL: str = "models/gemini-embedding-001"
     MAX_TOKEN: int = 2000
     TEMPERATURE: float = 0.1
+    LLM_CONCURRENCY: int = 16  # Max in-flight structured-output calls per worker
+    LLM_WARMUP_PING: bool = (
+        False  # Send one tiny (billed) request at startup to open the connection
+    )
+
+    # LLM Response Cache
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL: int = 7 * 24 * 60 * 60  # 7 days
+    LLM_CACHE_MAX_ITEMS: int = 1024  # In-memory fallback only
+
+    # Semantic (embedding) Cache for near-duplicate documents
+    SEMANTIC_CACHE_ENABLED: bool = False
+    SEMANTIC_CACHE_THRESHOLD: float = 0.97  # Cosine similarity required for a hit
+    SEMANTIC_CACHE_TTL: int = 7 * 24 * 60 * 60  # 7 days
+    SEMANTIC_CACHE_MAX_ITEMS: int = 5000  # Per document type
+
+    # Keyword prefilter that classifies unambiguous documents without an LLM call
+    CLASSIFICATION_PREFILTER_ENABLED: bool = True
 
     # Global Variables
     API_PREFIX: str = "/api/v1"
@@ -55,9 +80,10 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "info"
     LOG_ROTATION: str = "00:00"
     LOG_RETENTION: str = "30 days"
+    LOG_JSON: bool = False  # Write file logs as JSON records (for log shippers)
 
-    # Configure the settings based on environment
-    model_config = SettingsConfigDict(case_sensitive=False, extra="ignore")
+    # Configure the settings based on environment (read-only once loaded)
+    model_config = SettingsConfigDict(case_sensitive=False, extra="ignore", frozen=True)
 
     @field_validator("CORS_ORIGINS", mode="before")
     @classmethod
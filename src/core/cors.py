@@ -0,0 +1,27 @@
+from collections.abc import Sequence
+from typing import Any
+
+from starlette.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    """
+    CORSMiddleware with a hashed origin lookup.
+
+    Starlette keeps `allow_origins` as the list it was given and checks each
+    request's Origin with a linear `in` scan. This keeps a frozenset copy so the
+    check is a single hash lookup, whatever the number of configured origins.
+    A wildcard origin (`["*"]`) is still short-circuited by the base class.
+    """
+
+    def __init__(self, app: ASGIApp, allow_origins: Sequence[str] = (), **kwargs: Any) -> None:
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self._allow_origins_set = frozenset(allow_origins)
+
+    def is_allowed_origin(self, origin: str) -> bool:
+        if self.allow_all_origins or origin in self._allow_origins_set:
+            return True
+        return self.allow_origin_regex is not None and bool(
+            self.allow_origin_regex.fullmatch(origin)
+        )
@@ -3,12 +3,20 @@ Modular LLM Provider with Singleton Pattern
 Supports multiple LLM providers with easy extensibility
 """
 
+import asyncio
+import json
+import threading
 from functools import lru_cache
 from typing import Any, Literal
 
-from langchain_core.language_models import BaseChatModel
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
+import httpx
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel, LanguageModelInput
+from langchain_core.messages import SystemMessage
+from langchain_core.runnables import Runnable, RunnableConfig, RunnableLambda
+from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+from pydantic import BaseModel
 
 # Commented imports for future use
 # from langchain_anthropic import ChatAnthropic
@@ -19,6 +27,23 @@ from src.core.config import settings
 
 LLMProvider = Literal["gemini", "openai", "anthropic", "grok", "perplexity", "deepseek"]
 
+# Providers in order of preference for the default LLM and embeddings
+PROVIDER_PRIORITY: list[LLMProvider] = [
+    "gemini",
+    "openai",
+    "anthropic",
+    "grok",
+    "perplexity",
+    "deepseek",
+]
+
+# Constructed chat models keyed by (provider, temperature, max_tokens, frozen kwargs)
+_LLM_CACHE: dict[tuple[str, float, int | None, str], BaseChatModel] = {}
+_LLM_CACHE_LOCK = threading.Lock()
+
+# Caps concurrent LLM requests from this worker so batches don't trip provider rate limits
+_LLM_SEMAPHORE = asyncio.Semaphore(settings.LLM_CONCURRENCY)
+
 
 class LLMProviderConfig:
     """Configuration for each LLM provider"""
@@ -34,12 +59,16 @@ class LLMProviderConfig:
                 "api_key": settings.GEMINI_API_KEY,
                 "model": settings.GEMINI_MODEL,
                 "class": ChatGoogleGenerativeAI,
+                "embedding_model": settings.GEMINI_EMBEDDING_MODEL,
+                "embedding_class": GoogleGenerativeAIEmbeddings,
                 "enabled": bool(settings.GEMINI_API_KEY),
             },
             "openai": {
                 "api_key": settings.OPENAI_API_KEY,
                 "model": settings.OPENAI_MODEL,
                 "class": ChatOpenAI,
+                "embedding_model": settings.OPENAI_EMBEDDING_MODEL,
+                "embedding_class": OpenAIEmbeddings,
                 "enabled": bool(settings.OPENAI_API_KEY),
             },
             # Uncomment and configure as needed
@@ -70,7 +99,20 @@ class LLMProviderConfig:
         }
 
 
-@lru_cache(maxsize=10)
+@lru_cache(maxsize=1)
+def _get_async_http_client() -> httpx.AsyncClient:
+    """Pooled HTTP client reused by provider SDKs that accept one."""
+    return httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+    )
+
+
+def _freeze_kwargs(kwargs: dict[str, Any]) -> str:
+    """Hashable form of provider kwargs, including nested dicts such as `model_kwargs`."""
+    return json.dumps(kwargs, sort_keys=True, default=repr)
+
+
 def get_llm(
     provider: LLMProvider = "gemini",
     temperature: float = 0.0,
@@ -78,7 +120,10 @@ def get_llm(
     **kwargs: Any,
 ) -> BaseChatModel:
     """
-    Returns a configured LLM instance with singleton pattern via LRU cache.
+    Returns a configured LLM instance with singleton pattern via a keyed cache.
+
+    Unlike `lru_cache`, the cache key tolerates unhashable kwargs (e.g. dicts),
+    and the lock ensures concurrent callers build each instance only once.
 
     Args:
         provider: The LLM provider to use
@@ -96,6 +141,23 @@ def get_llm(
         >>> llm = get_llm("openai", temperature=0.7)
         >>> response = llm.invoke("Hello, world!")
     """
+    key = (provider, temperature, max_tokens, _freeze_kwargs(kwargs))
+    llm = _LLM_CACHE.get(key)
+    if llm is not None:
+        return llm
+
+    with _LLM_CACHE_LOCK:
+        llm = _LLM_CACHE.get(key)
+        if llm is None:
+            llm = _build_llm(provider, temperature, max_tokens, **kwargs)
+            _LLM_CACHE[key] = llm
+    return llm
+
+
+def _build_llm(
+    provider: LLMProvider, temperature: float, max_tokens: int | None, **kwargs: Any
+) -> BaseChatModel:
+    """Instantiates the chat model for `get_llm`."""
     config = LLMProviderConfig.get_provider_config()
 
     if provider not in config:
@@ -125,15 +187,20 @@ def get_llm(
     if max_tokens is not None:
         init_args["max_tokens"] = max_tokens
 
+    # Share one keep-alive connection pool across all OpenAI clients
+    if provider == "openai":
+        init_args.setdefault("http_async_client", _get_async_http_client())
+
     # Initialize and return the LLM
     llm_class = provider_config["class"]
-    return llm_class(**init_args)
+    llm: BaseChatModel = llm_class(**init_args)
+    return llm
 
 
 def get_default_llm(temperature: float = 0.0, **kwargs: Any) -> BaseChatModel:
     """
     Returns the default/fallback LLM provider.
-    Tries providers in order of preference.
+    Tries providers in order of preference; the instance itself is cached by `get_llm`.
 
     Args:
         temperature: Model temperature
@@ -145,14 +212,113 @@ def get_default_llm(temperature: float = 0.0, **kwargs: Any) -> BaseChatModel:
     Raises:
         ValueError: If no LLM providers are configured
     """
-    config = LLMProviderConfig.get_provider_config()
-    priority_order = ["gemini", "openai", "anthropic", "grok", "perplexity", "deepseek"]
+    provider = get_default_provider()
+    if provider is None:
+        raise ValueError(
+            "No LLM providers configured. Please set at least one API key in settings."
+        )
+    return get_llm(provider, temperature=temperature, **kwargs)
+
 
-    for provider in priority_order:
+def get_default_provider() -> LLMProvider | None:
+    """
+    Returns the first configured provider in `PROVIDER_PRIORITY`, or None if none is.
+    """
+    config = LLMProviderConfig.get_provider_config()
+    for provider in PROVIDER_PRIORITY:
         if provider in config and config[provider]["enabled"]:
-            return get_llm(provider, temperature=temperature, **kwargs)
+            return provider
+    return None
+
+
+@lru_cache(maxsize=8)
+def default_model_id(temperature: float = 0.0) -> str:
+    """
+    Identify the model `get_default_llm(temperature)` returns, as `provider:model:temperature`.
+
+    Used to namespace cached LLM responses, so switching provider, model or
+    temperature never serves another model's answers.
+    """
+    provider = get_default_provider()
+    if provider is None:
+        return "none"
+    model = LLMProviderConfig.get_provider_config()[provider]["model"]
+    return f"{provider}:{model}:{temperature}"
+
+
+def build_system_message(prompt: str) -> SystemMessage:
+    """
+    Wraps a static system prompt so the default provider can cache it as a prefix.
+
+    OpenAI and Gemini cache long shared prefixes implicitly, so they get a plain
+    message. Anthropic only caches blocks marked with `cache_control`.
+
+    Args:
+        prompt: Static system prompt text
+
+    Returns:
+        SystemMessage to place first in every prompt
+    """
+    if get_default_provider() == "anthropic":
+        return SystemMessage(
+            content=[{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+        )
+    return SystemMessage(content=prompt)
+
+
+@lru_cache(maxsize=16)
+def get_structured_llm(
+    schema: type[BaseModel], temperature: float = 0.0
+) -> Runnable[LanguageModelInput, Any]:
+    """
+    Returns the default LLM bound to a structured output schema.
+
+    `with_structured_output` converts the schema to a tool/JSON spec and builds a
+    new runnable chain on every call; memoizing it keeps that off the request path.
+
+    Calls are gated by a per-worker semaphore (LLM_CONCURRENCY), so concurrent
+    nodes and `abatch` fan-outs never exceed the configured number of requests.
+
+    Args:
+        schema: Pydantic model the LLM must return
+        temperature: Model temperature
+
+    Returns:
+        Runnable that parses LLM output into `schema`
+    """
+    structured_llm = get_default_llm(temperature=temperature).with_structured_output(schema)
+
+    async def _limited_invoke(messages: LanguageModelInput, config: RunnableConfig) -> Any:
+        async with _LLM_SEMAPHORE:
+            return await structured_llm.ainvoke(messages, config=config)
+
+    return RunnableLambda(_limited_invoke, name=f"{schema.__name__}StructuredLLM")
+
+
+@lru_cache(maxsize=1)
+def get_default_embeddings() -> Embeddings:
+    """
+    Returns the embedding model of the first configured provider that offers one.
+    Follows the same priority order as `get_default_llm`.
+
+    Returns:
+        Configured embeddings instance
+
+    Raises:
+        ValueError: If no configured provider supports embeddings
+    """
+    config = LLMProviderConfig.get_provider_config()
+
+    for provider in PROVIDER_PRIORITY:
+        provider_config = config.get(provider)
+        if provider_config and provider_config["enabled"] and "embedding_class" in provider_config:
+            embedding_class = provider_config["embedding_class"]
+            embeddings: Embeddings = embedding_class(
+                model=provider_config["embedding_model"], api_key=provider_config["api_key"]
+            )
+            return embeddings
 
-    raise ValueError("No LLM providers configured. Please set at least one API key in settings.")
+    raise ValueError("No embedding providers configured. Please set at least one API key.")
 
 
 def list_available_providers() -> list[str]:
@@ -171,4 +337,7 @@ def clear_llm_cache() -> None:
     Clears the LLM cache. Useful for testing or if you need to force
     re-initialization of LLM instances.
     """
-    get_llm.cache_clear()
+    with _LLM_CACHE_LOCK:
+        _LLM_CACHE.clear()
+    get_structured_llm.cache_clear()
+    get_default_embeddings.cache_clear()
@@ -1,3 +1,6 @@
+import asyncio
+import socket
+
 import redis.asyncio as redis
 from fastapi_limiter import FastAPILimiter
 
@@ -8,10 +11,53 @@ from src.utils.logger import log
 # Global variable to hold the Redis connection
 redis_client: redis.Redis | None = None
 
+# Probe idle connections so dead peers (e.g. a restarted container) are detected in ~1 minute
+_KEEPALIVE_OPTIONS: dict[int, int] = {
+    opt: value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if (opt := getattr(socket, name, None)) is not None
+}
+
+
+def _build_connection_pool() -> redis.BlockingConnectionPool:
+    """
+    Build the connection pool for the configured transport.
+
+    A Unix domain socket (REDIS_UNIX_SOCKET_PATH) skips the loopback TCP stack
+    when Redis runs on the same host; otherwise REDIS_URL is used over TCP.
+    The pool holds at most REDIS_POOL_SIZE connections; when all are busy a
+    caller waits up to a second for one instead of opening another socket.
+    """
+    common = {
+        "max_connections": settings.REDIS_POOL_SIZE,
+        "timeout": 1.0,
+        "encoding": "utf-8",
+        "decode_responses": True,
+        "socket_timeout": 5.0,
+    }
+
+    if settings.REDIS_UNIX_SOCKET_PATH:
+        return redis.BlockingConnectionPool(
+            connection_class=redis.UnixDomainSocketConnection,
+            path=settings.REDIS_UNIX_SOCKET_PATH,
+            **common,
+        )
+
+    return redis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        socket_keepalive=True,
+        socket_keepalive_options=_KEEPALIVE_OPTIONS,
+        **common,
+    )
+
 
 async def create_redis_client() -> redis.Redis:
     """
-    Create and return an asynchronous Redis client using the settings.REDIS_URL.
+    Create and return an asynchronous Redis client using settings.REDIS_URL, or
+    settings.REDIS_UNIX_SOCKET_PATH when set.
+
+    TCP connections use keepalive. Nagle's algorithm is already disabled on them:
+    redis-py and asyncio both set TCP_NODELAY on every TCP connection they open.
 
     Returns:
         redis.Redis: An instance of the asynchronous Redis client.
@@ -20,13 +66,11 @@ async def create_redis_client() -> redis.Redis:
         Exception: If the connection to Redis fails.
     """
     try:
-        log.info(f"🔌 Connecting to Redis at {settings.REDIS_URL}...")
-        client = redis.from_url(
-            settings.REDIS_URL,
-            encoding="utf-8",
-            decode_responses=True,
-            socket_timeout=5.0,
-        )
+        target = settings.REDIS_UNIX_SOCKET_PATH or settings.REDIS_URL
+        log.info(f"🔌 Connecting to Redis at {target}...")
+        pool = _build_connection_pool()
+        # from_pool hands pool ownership to the client, so closing the client closes the pool
+        client = redis.Redis.from_pool(pool)
         await client.ping()
         log.info("✅ Connected to Redis successfully")
         return client
@@ -35,6 +79,29 @@ async def create_redis_client() -> redis.Redis:
         raise e
 
 
+async def prewarm_connection_pool(redis_instance: redis.Redis) -> None:
+    """
+    Open every pooled connection up front so early requests don't pay the connect cost.
+
+    Args:
+        redis_instance (redis.Redis): The client whose pool should be filled.
+    """
+    pool = redis_instance.connection_pool
+    # The client's ping already opened one connection, which is handed out again here
+    results = await asyncio.gather(
+        *[pool.get_connection() for _ in range(pool.max_connections)], return_exceptions=True
+    )
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    for connection in connections:
+        await pool.release(connection)
+
+    if len(connections) < len(results):
+        error = next(res for res in results if isinstance(res, BaseException))
+        log.warning(f"⚠️ Redis pool pre-warm incomplete, connections will open lazily: {error}")
+    else:
+        log.info(f"🔥 Redis connection pool pre-warmed ({len(connections)} connections)")
+
+
 async def setup_fastapi_limiter(redis_instance: redis.Redis) -> None:
     """
     Initialize the FastAPI Rate Limiter with the given Redis instance.
@@ -64,6 +131,7 @@ async def init_redis() -> None:
     global redis_client
     try:
         redis_client = await create_redis_client()
+        await prewarm_connection_pool(redis_client)
         await setup_fastapi_limiter(redis_client)
     except Exception as e:
         log.error(f"❌ Redis/Rate Limiter initialization failed: {e}")
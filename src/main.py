@@ -3,12 +3,18 @@ from contextlib import asynccontextmanager
 from typing import Any
 
 from fastapi import FastAPI, status
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 
+from src.ai.cache import cache_hits, cache_misses
+from src.ai.semantic_cache import semantic_cache
+from src.ai.warmup import warm_up_ai
 from src.api.v1 import api_router
+from src.core.aws import warm_up_s3
 from src.core.config import settings
+from src.core.cors import FastCORSMiddleware
 from src.core.redis import close_redis, init_redis
 from src.utils.logger import log
+from src.utils.pdf_loader import shutdown_markdown_pool
 
 
 @asynccontextmanager
@@ -20,11 +26,23 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     log.info(f"🚀 Starting SureCheck AI in {settings.APP_ENV} mode...")
     log.info(f"✅ Loaded Settings for: {settings.APP_ENV}")
     await init_redis()
+    await run_in_threadpool(warm_up_s3)
+    if settings.SEMANTIC_CACHE_ENABLED:
+        semantic_cache.load()
+    await warm_up_ai()
 
     yield
 
     log.info("🛑 Shutting down SureCheck AI...")
     await close_redis()
+    shutdown_markdown_pool()
+    if settings.LLM_CACHE_ENABLED:
+        log.info(f"♻️ LLM cache stats (hits: {cache_hits.total()}, misses: {cache_misses.total()})")
+    if settings.SEMANTIC_CACHE_ENABLED:
+        semantic_cache.save()
+        log.info(
+            f"♻️ Semantic cache saved (hits: {semantic_cache.hits}, misses: {semantic_cache.misses})"
+        )
 
 
 app: FastAPI = FastAPI(
@@ -43,7 +61,7 @@ app: FastAPI = FastAPI(
 )
 
 # Middleware configuration
-app.add_middleware(CORSMiddleware, allow_origins=settings.CORS_ORIGINS, allow_credentials=True)
+app.add_middleware(FastCORSMiddleware, allow_origins=settings.CORS_ORIGINS, allow_credentials=True)
 
 # Include API Router
 app.include_router(api_router, prefix=settings.API_PREFIX)
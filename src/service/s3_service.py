@@ -1,18 +1,33 @@
-import io
 import re
-from datetime import datetime
+import string
+import time
 from pathlib import Path
+from types import MappingProxyType
 
-import boto3
-from botocore.config import Config
 from botocore.exceptions import ClientError
 from fastapi import HTTPException, status
 from mypy_boto3_s3.client import S3Client
 
-from src.core.aws import AWSConfig
+from src.core.aws import AWSConfig, s3_client
 from src.schema.file_dto import FileMetadata, PresignedUrlResponse
 from src.utils.logger import log
 
+UPLOAD_FOLDER = "surecheck/uploads"
+MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+ALLOWED_EXTENSIONS = frozenset({".pdf", ".doc", ".docx", ".txt"})
+MIME_TYPES = MappingProxyType(
+    {
+        ".pdf": "application/pdf",
+        ".doc": "application/msword",
+        ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        ".txt": "text/plain",
+    }
+)
+
+# Plain ASCII names are checked with a set scan; the regex only handles non-ASCII word characters
+_SAFE_FILENAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-. ")
+_SAFE_FILENAME_RE = re.compile(r"[\w\-. ]+")
+
 
 class S3Manager:
     """
@@ -21,64 +36,23 @@ class S3Manager:
     This class provides high-level functionality for uploading, downloading, and generating presigned
     URLs for files, as well as file validation and key generation.
 
+    Upload folder, size limit, allowed extensions and MIME types are module-level
+    constants (`UPLOAD_FOLDER`, `MAX_FILE_SIZE`, `ALLOWED_EXTENSIONS`, `MIME_TYPES`).
+
     Attributes:
         config (AWSConfig): Holds AWS credentials and settings
-        _client (S3Client | None): Cached S3 client, lazily instantiated
-        UPLOAD_FOLDER (str): Base path for uploaded files in the S3 bucket
-        SAFE_FILENAME_REGEX (re.Pattern): Regex pattern for validating safe filenames
-        MAX_FILE_SIZE (int): Maximum allowed upload file size in bytes
-        ALLOWED_EXTENSIONS (set[str]): Allowed file extensions
-        MIME_TYPES (dict[str, str]): Mapping of file extensions to MIME types
+        client (S3Client): Shared S3 client from `src.core.aws`
     """
 
     def __init__(self) -> None:
         """
         Initialize the S3Manager instance.
 
-        This sets up configuration using application AWS settings, prepares the S3 client cache,
-        and defines upload folder, validation patterns, file extension whitelist, and MIME type mapping.
+        This sets up configuration using application AWS settings and uses the shared S3 client
+        (created once at import by `src.core.aws`).
         """
         self.config = AWSConfig()
-        self._client: S3Client | None = None
-
-        self.UPLOAD_FOLDER = "surecheck/uploads"
-        self.SAFE_FILENAME_REGEX = re.compile(r"^[\w\-. ]+$")
-        self.MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
-
-        self.ALLOWED_EXTENSIONS = {".pdf", ".doc", ".docx", ".txt"}
-        self.MIME_TYPES = {
-            ".pdf": "application/pdf",
-            ".doc": "application/msword",
-            ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-            ".txt": "text/plain",
-        }
-
-    @property
-    def client(self) -> S3Client:
-        """
-        Get a cached boto3 S3 client, lazily instantiating it if necessary.
-
-        Returns:
-            S3Client: The S3 client configured with AWS credentials/region
-
-        Raises:
-            HTTPException: If the S3 client cannot be created for any reason.
-        """
-        if self._client is None:
-            try:
-                self._client = boto3.client(
-                    "s3",
-                    region_name=self.config.region,
-                    aws_access_key_id=self.config.aws_access_key,
-                    aws_secret_access_key=self.config.aws_secret_key,
-                    config=Config(signature_version="s3v4"),
-                )
-            except Exception as e:
-                log.error(f"Failed to initialize S3 client: {e}")
-                raise HTTPException(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="S3 Connection Error"
-                ) from e
-        return self._client
+        self.client: S3Client = s3_client
 
     def _validate_file_params(self, filename: str, file_size: int | None = None) -> FileMetadata:
         """
@@ -102,25 +76,27 @@ class S3Manager:
             if not filename:
                 raise ValueError("Filename must not be empty")
 
-            if not self.SAFE_FILENAME_REGEX.match(filename):
+            if not (
+                _SAFE_FILENAME_CHARS.issuperset(filename) or _SAFE_FILENAME_RE.fullmatch(filename)
+            ):
                 raise ValueError("Invalid filename format")
 
             file_path = Path(filename)
             ext = file_path.suffix.lower()
 
-            if ext not in self.ALLOWED_EXTENSIONS:
+            if ext not in ALLOWED_EXTENSIONS:
                 raise ValueError(
-                    f"Unsupported file extension for {ext}. Allowed: {self.ALLOWED_EXTENSIONS}"
+                    f"Unsupported file extension for {ext}. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
                 )
 
-            mime_type = self.MIME_TYPES.get(ext)
+            mime_type = MIME_TYPES.get(ext)
             if mime_type is None:
                 raise ValueError(f"Unsupported mime type for {ext}")
 
-            if file_size and file_size > self.MAX_FILE_SIZE:
+            if file_size and file_size > MAX_FILE_SIZE:
                 raise HTTPException(
                     status_code=status.HTTP_413_CONTENT_TOO_LARGE,
-                    detail=f"File size should be within {self.MAX_FILE_SIZE / 1048576}MB",
+                    detail=f"File size should be within {MAX_FILE_SIZE / 1048576}MB",
                 )
             return FileMetadata(extension=ext, mime_type=mime_type, size=file_size)
 
@@ -132,7 +108,7 @@ class S3Manager:
 
     def _build_file_key(self, filename: str) -> str:
         """
-        Build a unique S3 file key with a timestamp, preserving extension.
+        Build a unique S3 file key with a microsecond Unix timestamp, preserving extension.
 
         Args:
             filename (str): Original filename.
@@ -144,12 +120,16 @@ class S3Manager:
             ValueError: If the key cannot be constructed.
         """
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_path = Path(filename)
-            base = file_path.stem
-            ext = file_path.suffix
-            unique_filename = f"{base}_{timestamp}{ext}"
-            return f"{self.UPLOAD_FOLDER}/{unique_filename}"
+            timestamp = time.time_ns() // 1000
+            # Drop any client-supplied directory part (either separator) so keys stay flat
+            name = filename.replace("\\", "/").rsplit("/", 1)[-1]
+            base, dot, ext = name.rpartition(".")
+            if not dot or not base or not ext:
+                # No extension (or a dotfile such as ".env"): keep the whole name as the base
+                base, ext = name, ""
+            else:
+                ext = f".{ext}"
+            return f"{UPLOAD_FOLDER}/{base}_{timestamp}{ext}"
         except Exception as e:
             log.error(f"Error building file key for {filename}: {e}")
             raise ValueError(f"Failed to generate file key: {e}") from e
@@ -172,8 +152,13 @@ class S3Manager:
         """
         try:
             file_key = self._build_file_key(file_name)
-            self.client.upload_fileobj(
-                Fileobj=io.BytesIO(file_bytes), Bucket=self.config.bucket_name, Key=file_key
+            mime_type = MIME_TYPES.get(Path(file_name).suffix.lower())
+            # Uploads are capped at 5MB, so a single PUT beats the multipart transfer manager
+            self.client.put_object(
+                Bucket=self.config.bucket_name,
+                Key=file_key,
+                Body=file_bytes,
+                ContentType=mime_type or "application/octet-stream",
             )
             log.info(f"✅ Background Upload Successful: {file_key}")
             return file_key
@@ -285,30 +270,36 @@ class S3Manager:
                 detail="Internal server error",
             ) from e
 
-    def get_download_url(self, file_key: str, expiration: int = 3600) -> PresignedUrlResponse:
+    def get_download_url(
+        self, file_key: str, expiration: int = 3600, verify: bool = False
+    ) -> PresignedUrlResponse:
         """
         Generate a presigned URL for downloading a file from S3 (GET object).
 
-        The method verifies if the file exists, and then produces a presigned URL for downloads.
+        Signing is local and makes no network call. A missing object surfaces as a
+        404 when the client fetches the URL; pass `verify=True` to check existence
+        up front at the cost of a `head_object` round trip.
 
         Args:
             file_key (str): The S3 file key for the object.
             expiration (int): Validity (in seconds) for the presigned URL.
+            verify (bool): Confirm the object exists before signing (default: False).
 
         Returns:
             PresignedUrlResponse: Information including URL and file key for downloading.
 
         Raises:
-            HTTPException: 404 if file is not found, or 500 for other errors.
+            HTTPException: 404 if `verify` is set and the file is not found.
         """
-        try:
-            self.client.head_object(Bucket=self.config.bucket_name, Key=file_key)
-        except ClientError as e:
-            if e.response["Error"]["Code"] == "404":
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
-                ) from e
-            raise
+        if verify:
+            try:
+                self.client.head_object(Bucket=self.config.bucket_name, Key=file_key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "404":
+                    raise HTTPException(
+                        status_code=status.HTTP_404_NOT_FOUND, detail="File not found"
+                    ) from e
+                raise
 
         url = self.client.generate_presigned_url(
             ClientMethod="get_object",
@@ -0,0 +1,30 @@
+"""
+Identifier Helpers
+Time-ordered UUIDs (version 7, RFC 9562) for claim IDs, so records inserted
+later sort later and keep B-tree index inserts local.
+"""
+
+import os
+import time
+import uuid
+
+_stdlib_uuid7 = getattr(uuid, "uuid7", None)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7: a 48-bit millisecond Unix timestamp followed by 74 random bits.
+
+    IDs from different milliseconds sort by creation time; within one millisecond
+    the order is random. Uses the standard library implementation on Python 3.14+.
+    """
+    if _stdlib_uuid7 is not None:
+        return _stdlib_uuid7()
+
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | rand & ((1 << 80) - 1)
+    # Set version (0111) and RFC 4122 variant (10) bits
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
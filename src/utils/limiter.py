@@ -1,4 +1,12 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
 from fastapi import Request
+from fastapi_limiter.depends import RateLimiter
+
+_FORWARDED_FOR = b"x-forwarded-for"
+_FALLBACK_IP = "127.0.0.1"
 
 
 async def get_real_ip(request: Request) -> str:
@@ -7,15 +15,54 @@ async def get_real_ip(request: Request) -> str:
 
     This checks standard headers like X-Forwarded-For which are set by load balancers.
     If not found, it falls back to the direct client host.
+
+    Reads the raw ASGI header list directly (ASGI servers lowercase header names)
+    rather than building a `Headers` object. Kept async because fastapi-limiter
+    awaits its identifier.
+    """
+    for name, value in request.scope["headers"]:
+        if name == _FORWARDED_FOR:
+            ip = value.split(b",", 1)[0].strip()
+            if ip:
+                return ip.decode("latin-1")
+            break
+
+    client = request.scope.get("client")
+    if client:
+        return client[0]
+
+    return _FALLBACK_IP
+
+
+class CachedRateLimiter(RateLimiter):
+    """
+    RateLimiter that remembers rejections locally until the Redis window expires.
+
+    fastapi-limiter uses a fixed window: once a key is over its limit, every
+    request is rejected until the key's TTL runs out, and rejected requests do
+    not change the counter. So the TTL Redis reports on the first rejection is
+    exact, and repeat requests in that window can be answered from memory
+    without an EVALSHA round trip. Allowed requests always go to Redis, so the
+    limit stays global across workers.
     """
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        ip = forwarded.split(",")[0].strip()
-        if isinstance(ip, str) and ip:
-            return ip
 
-    client_host = getattr(request.client, "host", None)
-    if isinstance(client_host, str) and client_host:
-        return client_host
+    _MAX_BLOCKED_KEYS = 10_000
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._blocked_until: OrderedDict[str, int] = OrderedDict()  # key -> monotonic ns deadline
+
+    async def _check(self, key: str) -> int:
+        deadline = self._blocked_until.get(key)
+        if deadline is not None:
+            remaining_ms = (deadline - time.monotonic_ns()) // 1_000_000
+            if remaining_ms > 0:
+                return remaining_ms
+            del self._blocked_until[key]
 
-    return "127.0.0.1"
+        pexpire = await super()._check(key)
+        if pexpire > 0:
+            self._blocked_until[key] = time.monotonic_ns() + pexpire * 1_000_000
+            if len(self._blocked_until) > self._MAX_BLOCKED_KEYS:
+                self._blocked_until.popitem(last=False)
+        return pexpire
@@ -7,6 +7,10 @@ from loguru import logger
 from src.core.config import settings
 from src.schema.app_dto import LogOptions
 
+# Compare level numbers (ints) rather than names in the per-record filters
+_INFO_NO = logger.level("INFO").no
+_ERROR_NO = logger.level("ERROR").no
+
 
 class LogConfig:
     """Centralized logging configuration"""
@@ -15,6 +19,16 @@ class LogConfig:
         self.base_dir = Path(settings.BASE_DIR) / "logs"
         self._configure_logger()
 
+        # Expose loguru's own methods so LogConfig behaves like a logger instance. Binding
+        # them directly (instead of wrapping in `logger.opt(depth=1)`) reports the caller's
+        # module/function/line without building a new Logger object on every call.
+        self.info = logger.info
+        self.error = logger.error
+        self.warning = logger.warning
+        self.debug = logger.debug
+        self.critical = logger.critical
+        self.exception = logger.exception
+
     def _get_log_file_path(self, log_type: str) -> str:
         """Generate log file path with current date"""
         log_dir = self.base_dir / f"{log_type}_logs"
@@ -27,48 +41,49 @@ class LogConfig:
 
         common_config = LogOptions(
             format="{time:YYYY-MM-DD HH:mm:ss} | {level:<8} | Module: {module:<8} | Fn: {function:<12} | Line: {line} - {message}",
-            enqueue=True,
+            # Write in the calling thread: a queue would pickle every record across a process pipe
+            enqueue=False,
             rotation=settings.LOG_ROTATION or "00:00",
             retention=settings.LOG_RETENTION or "7 days",
             compression="zip",
-            serialize=True,
+            serialize=settings.LOG_JSON,
             catch=True,
-        )
+        ).model_dump()
 
         # Configure log handlers with proper file and line formatting
         logger.add(
             sink=self._get_log_file_path("app"),
             level="INFO",
-            filter=lambda r: r["level"].name == "INFO",
-            **common_config.model_dump(),
+            filter=lambda r: r["level"].no == _INFO_NO,
+            **common_config,
         )
 
         logger.add(
             self._get_log_file_path("error"),
             level="ERROR",
-            filter=lambda r: r["level"].name == "ERROR",
-            **common_config.model_dump(),
+            filter=lambda r: r["level"].no == _ERROR_NO,
+            **common_config,
         )
 
         logger.add(
             self._get_log_file_path("db_error"),
             level="CRITICAL",
             filter=lambda r: r["extra"].get("database") or False,
-            **common_config.model_dump(),
+            **common_config,
         )
 
         logger.add(
             self._get_log_file_path("audit"),
             level="INFO",
             filter=lambda r: r["extra"].get("audit") or False,
-            **common_config.model_dump(),
+            **common_config,
         )
 
         logger.add(
             self._get_log_file_path("performance"),
             level="DEBUG",
             filter=lambda r: r["extra"].get("performance") or False,
-            **common_config.model_dump(),
+            **common_config,
         )
 
         # Add console handler for development with file and line info
@@ -82,31 +97,6 @@ class LogConfig:
                 format="<level>{level}: \t</level> <yellow>{time:YYYY-MM-DD HH:mm:ss}</yellow> | <cyan>Module: {module:<8}</cyan> | <cyan>Fn: {function:<12}</cyan> | <cyan>Line: {line}</cyan> - \n<level>{message}</level>",
             )
 
-    # Add proxy methods to make LogConfig behave like a logger instance
-    def info(self, message: str) -> None:
-        """Log an info message"""
-        logger.opt(depth=1).info(message)
-
-    def error(self, message: str) -> None:
-        """Log an error message"""
-        logger.opt(depth=1).error(message)
-
-    def warning(self, message: str) -> None:
-        """Log a warning message"""
-        logger.opt(depth=1).warning(message)
-
-    def debug(self, message: str) -> None:
-        """Log a debug message"""
-        logger.opt(depth=1).debug(message)
-
-    def critical(self, message: str) -> None:
-        """Log a critical message"""
-        logger.opt(depth=1).critical(message)
-
-    def exception(self, message: str) -> None:
-        """Log an exception with traceback"""
-        logger.opt(depth=1).exception(message)
-
 
 # Singletone Log Instance
 log: LogConfig = LogConfig()
@@ -0,0 +1,31 @@
+"""
+Markdown Worker
+Process-pool task for converting PDF pages to markdown. Kept free of app imports, so the
+spawned worker processes load only PyMuPDF and pymupdf4llm (no settings, LLM clients or
+log sinks).
+"""
+
+import fitz  # PyMuPDF
+import pymupdf4llm
+
+# Pages per pymupdf4llm call; also the page-range unit for the process pool
+PAGES_PER_MARKDOWN_TASK = 25
+
+
+def batched_markdown(doc: fitz.Document, pages: list[int]) -> str:
+    """
+    Convert the given pages to markdown a batch at a time.
+
+    pymupdf4llm keeps its layout data for every page of a call until it returns, so
+    converting a long document in batches bounds that to one batch.
+    """
+    return "".join(
+        str(pymupdf4llm.to_markdown(doc, pages=pages[start : start + PAGES_PER_MARKDOWN_TASK]))
+        for start in range(0, len(pages), PAGES_PER_MARKDOWN_TASK)
+    )
+
+
+def markdown_for_pages(file_bytes: bytes, pages: list[int]) -> str:
+    """Process-pool task: convert the given pages of a PDF to markdown."""
+    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
+        return batched_markdown(doc, pages)
@@ -1,119 +1,411 @@
 import base64
+import hashlib
+import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import cache
+from types import ModuleType
+from typing import NamedTuple
 
 import fitz  # PyMuPDF
 import pymupdf4llm
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage
 
+from src.core.config import settings
 from src.core.llm import get_default_llm
 from src.utils.logger import log
+from src.utils.markdown_worker import PAGES_PER_MARKDOWN_TASK, batched_markdown, markdown_for_pages
 
+# Scanned documents are transcribed up to this many pages
+OCR_MAX_PAGES = 5
 
-def _perform_ai_ocr(doc: fitz.Document) -> str:
+# OCR render resolution: ~150 DPI, with the longest edge capped to what vision models ingest
+OCR_TARGET_DPI = 150
+OCR_MAX_EDGE_PX = 2048
+
+# JPEG quality for OCR page images; text stays legible at a fraction of the PNG size
+OCR_JPEG_QUALITY = 85
+
+# Instruction sent with every page image (shared; message content is only read)
+_OCR_TEXT_PART: dict[str, str] = {
+    "type": "text",
+    "text": (
+        "Transcribe the text in this document page exactly as it appears. "
+        "Preserve markdown formatting for tables and headers if possible."
+    ),
+}
+
+# Extracted text of recently seen files, keyed by content digest (LRU; called from threadpool)
+TEXT_CACHE_MAX_ITEMS = 128
+_TEXT_CACHE: OrderedDict[bytes, str] = OrderedDict()
+_TEXT_CACHE_LOCK = threading.Lock()
+
+# Long digital PDFs are converted to markdown in page ranges on a process pool, since
+# pymupdf4llm is single-threaded. The pool is small because each web worker owns one.
+PARALLEL_MARKDOWN_MIN_PAGES = 50
+MARKDOWN_MAX_WORKERS = min(4, os.cpu_count() or 1)
+_markdown_pool: ProcessPoolExecutor | None = None
+_markdown_pool_lock = threading.Lock()
+
+# PyMuPDF is not thread-safe (MuPDF state is shared process-wide, not per document), so all
+# document work in this worker process, across every concurrent request, happens under this
+# lock. Only the OCR network waits and the markdown process pool run outside it.
+_MUPDF_LOCK = threading.Lock()
+
+# OCR page requests from all documents share one pool, bounded like the other LLM calls
+_OCR_EXECUTOR = ThreadPoolExecutor(max_workers=settings.LLM_CONCURRENCY, thread_name_prefix="ocr")
+
+
+def _render_zoom(rect: fitz.Rect) -> float:
+    """Zoom factor that renders a page at OCR_TARGET_DPI without exceeding OCR_MAX_EDGE_PX."""
+    longest_pt = max(rect.width, rect.height)
+    if longest_pt <= 0:
+        return 1.5
+    zoom = OCR_TARGET_DPI / 72  # PDF user space is 72 points per inch
+    return min(zoom, OCR_MAX_EDGE_PX / longest_pt)
+
+
+@cache
+def _pillow_image() -> ModuleType | None:
+    """Pillow's Image module if installed (optional; it is not a project dependency)."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def _encode_page_image(pix: fitz.Pixmap) -> tuple[bytes, str]:
+    """Encode a rendered page for the vision LLM, returning (image bytes, MIME type)."""
+    # JPEG has no alpha channel; page renders are opaque unless alpha was requested
+    if pix.alpha:
+        return pix.tobytes("png"), "image/png"
+
+    image = _pillow_image()
+    if image is not None and pix.n in (1, 3):
+        # Pillow's libjpeg-turbo encoder reads the pixmap's samples in place (no bytes copy)
+        mode = "L" if pix.n == 1 else "RGB"
+        buffer = io.BytesIO()
+        image.frombuffer(
+            mode, (pix.width, pix.height), pix.samples_mv, "raw", mode, pix.stride, 1
+        ).save(buffer, "JPEG", quality=OCR_JPEG_QUALITY)
+        return buffer.getvalue(), "image/jpeg"
+
+    return pix.tobytes("jpeg", jpg_quality=OCR_JPEG_QUALITY), "image/jpeg"
+
+
+class _PendingOCR(NamedTuple):
+    """OCR requests in flight for some pages of a document."""
+
+    pages: list[int]  # Page indices that were rendered and submitted
+    futures: list[Future[BaseMessage]]
+    truncated: bool  # More pages needed OCR than OCR_MAX_PAGES
+
+
+def _submit_ai_ocr(
+    doc: fitz.Document, pages: Sequence[int] | None = None, limit: int = OCR_MAX_PAGES
+) -> _PendingOCR:
     """
-    Perform OCR on a scanned PDF document using an AI LLM with vision capability.
+    Start OCR of a PDF's pages using an AI LLM with vision capability.
 
-    This function renders up to the first 5 pages of the given fitz.Document as PNG images
-    (at 2x zoom for enhanced OCR accuracy), then sends them to an LLM supporting vision
-    (e.g., Gemini-2.5-flash or GPT-4.1) for transcription.
+    Renders up to the first `limit` (default 5) of the given pages (default: every page) as grayscale JPEG
+    images (at ~150 DPI, capped at 2048px on the longest edge) and submits each one to an LLM
+    supporting vision (e.g., Gemini-2.5-flash or GPT-4.1) for transcription as soon as it is
+    rendered, so later renders overlap the earlier network waits. Only rendering touches
+    `doc`; once this returns the document can be closed before the results are collected
+    with `_collect_ai_ocr`.
 
     Args:
         doc (fitz.Document): The PDF document to OCR.
+        pages (Sequence[int] | None): Page indices to transcribe (default: every page).
+        limit (int): Maximum number of pages to transcribe.
 
     Returns:
-        str: Concatenated plain text (with basic markdown formatting if present), as transcribed
-             by the vision LLM. If more than 5 pages, a note about truncation is appended.
+        _PendingOCR: The submitted requests, in page order.
     """
-    full_text: list[str] = []
+    if pages is None:
+        pages = range(doc.page_count)
+    selected = list(pages[: max(limit, 0)])
     llm = get_default_llm(temperature=0.0)
 
-    log.info("👁️  Engaging AI Vision for OCR (Scanned Document detected)...")
+    log.info(f"👁️  Engaging AI Vision for OCR ({len(selected)} of {len(pages)} page(s))...")
 
-    for i, page in enumerate[fitz.Page](doc):
-        if i >= 5:
-            full_text.append("\n...[Remaining pages truncated]...")
-            break
+    # Rendering stays on this thread (PyMuPDF is not thread-safe); only the requests run on
+    # the OCR pool. Only the pages being transcribed are loaded.
+    futures: list[Future[BaseMessage]] = []
+    for i in selected:
+        page = doc.load_page(i)
 
-        # Render Page to Image (PNG)
-        pix: fitz.Pixmap = page.get_pixmap(matrix=fitz.Matrix(2, 2))
-        img_bytes: bytes = pix.tobytes("png")
+        # Render Page to Image
+        zoom = _render_zoom(page.rect)
+        # Text only needs luminance: one channel is a third of the RGB samples to encode
+        pix: fitz.Pixmap = page.get_pixmap(
+            matrix=fitz.Matrix(zoom, zoom), colorspace=fitz.csGRAY, alpha=False
+        )
+        img_bytes, mime_type = _encode_page_image(pix)
         img_base64 = base64.b64encode(img_bytes).decode("utf-8")
 
         msg = HumanMessage(
             content=[
-                {
-                    "type": "text",
-                    "text": "Transcribe the text in this document page exactly as it appears. Preserve markdown formatting for tables and headers if possible.",
-                },
+                _OCR_TEXT_PART,
                 {
                     "type": "image_url",
-                    "image_url": {"url": f"data:image/png;base64,{img_base64}"},
+                    "image_url": {"url": f"data:{mime_type};base64,{img_base64}"},
                 },
             ]
         )
+        futures.append(_OCR_EXECUTOR.submit(llm.invoke, [msg]))
+
+    return _PendingOCR(selected, futures, truncated=len(pages) > len(selected))
+
+
+def _merge_ocr(first: _PendingOCR | None, second: _PendingOCR) -> _PendingOCR:
+    """Combine two sets of OCR requests for different pages of a document, in page order."""
+    if first is None:
+        return second
+    ordered = sorted(
+        zip(first.pages + second.pages, first.futures + second.futures, strict=True),
+        key=lambda item: item[0],
+    )
+    return _PendingOCR(
+        [page for page, _ in ordered],
+        [future for _, future in ordered],
+        truncated=first.truncated or second.truncated,
+    )
+
+
+def _collect_ai_ocr(pending: _PendingOCR) -> tuple[str, bool]:
+    """
+    Wait for submitted OCR requests and assemble their transcriptions.
 
+    Returns:
+        tuple[str, bool]: Concatenated plain text (with basic markdown formatting if present), as
+             transcribed by the vision LLM, and whether every page was transcribed. Failed pages
+             are logged and left out. If more than 5 pages, a note about truncation is appended.
+    """
+    full_text: list[str] = []
+    ok = True
+    for i, future in zip(pending.pages, pending.futures, strict=True):
         try:
-            response = llm.invoke([msg])
-            full_text.append(f"--- PAGE {i+1} (OCR) ---\n{response.content}")
+            response = future.result()
+            full_text.append(f"--- PAGE {i + 1} (OCR) ---\n{response.content}")
         except Exception as e:
-            log.error(f"OCR Failed for page {i+1}: {e}")
+            log.error(f"OCR Failed for page {i + 1}: {e}")
+            ok = False
 
-    return "\n".join(full_text)
+    if pending.truncated:
+        full_text.append("\n...[Remaining pages truncated]...")
 
+    return "\n".join(full_text), ok
 
-def extract_text_from_bytes(file_bytes: bytes, filename: str) -> str:
+
+def _get_markdown_pool() -> ProcessPoolExecutor:
+    global _markdown_pool
+    with _markdown_pool_lock:
+        if _markdown_pool is None:
+            # Spawned (not forked) workers: forking a threaded server process is unsafe
+            _markdown_pool = ProcessPoolExecutor(
+                max_workers=MARKDOWN_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        return _markdown_pool
+
+
+def _discard_markdown_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool (unless another thread already replaced it) without waiting on it."""
+    global _markdown_pool
+    with _markdown_pool_lock:
+        if _markdown_pool is pool:
+            _markdown_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_markdown_pool() -> None:
+    """Stop the markdown worker processes, if any were started. Call at application shutdown."""
+    global _markdown_pool
+    with _markdown_pool_lock:
+        if _markdown_pool is not None:
+            _markdown_pool.shutdown(cancel_futures=True)
+            _markdown_pool = None
+
+
+def _parallel_markdown(file_bytes: bytes, pages: list[int]) -> str:
+    """Convert the given pages of a long PDF to markdown, split across the process pool."""
+    tasks = min(MARKDOWN_MAX_WORKERS, len(pages) // PAGES_PER_MARKDOWN_TASK)
+    chunk_size = -(-len(pages) // tasks)  # ceil division
+    page_ranges = [pages[start : start + chunk_size] for start in range(0, len(pages), chunk_size)]
+    pool = _get_markdown_pool()
+    try:
+        return "".join(pool.map(markdown_for_pages, [file_bytes] * len(page_ranges), page_ranges))
+    except BrokenProcessPool:
+        # A worker died (e.g. crashed or OOM-killed on a malformed PDF); drop the pool so the
+        # next long document starts a fresh one, and let the caller fall back to raw text
+        _discard_markdown_pool(pool)
+        raise
+
+
+def _extract_from_document(
+    doc: fitz.Document, file_bytes: bytes, filename: str
+) -> tuple[str, _PendingOCR | None]:
+    """
+    Extract what can be read directly from an open PDF and start OCR for the rest.
+
+    Returns:
+        (extracted text, OCR still in flight or None)
+    """
+    if doc.needs_pass:
+        log.warning(f"⚠️ Document is password-protected: {filename}")
+        return "", None
+
+    if doc.page_count == 0:
+        log.warning(f"⚠️ Document is empty: {filename}")
+        return "", None
+
+    # Text can only be drawn with a font, so a page without fonts has no text layer.
+    # get_page_fonts only reads the page's resources, which is far cheaper than text extraction.
+    has_fonts = [bool(doc.get_page_fonts(i)) for i in range(doc.page_count)]
+
+    # --- Check 1: Check If the pdf is a Scanned Image ---
+    # No fonts anywhere means a scan. Fonts alone don't prove a digital document (a scan can
+    # carry a stamp, Bates number or watermark), so probe the top of the first page, where
+    # digital documents have their header. If it is empty, confirm on the whole first, middle
+    # and last pages (e.g. a title-only cover page) before paying for OCR. Pages without fonts
+    # have no text to extract; if none of those three has fonts, the first page that does is
+    # probed instead.
+    if not any(has_fonts):
+        is_scanned = True
+    else:
+        header_text = ""
+        if has_fonts[0]:
+            first_page = doc[0]
+            rect = first_page.rect
+            header_clip = fitz.Rect(rect.x0, rect.y0, rect.x1, min(rect.y1, rect.y0 + 400))
+            header_text = first_page.get_text("text", clip=header_clip)
+        sampled = {0, doc.page_count // 2, doc.page_count - 1}
+        probe_pages = {i for i in sampled if has_fonts[i]} or {has_fonts.index(True)}
+        is_scanned = len(header_text.strip()) < 20 and all(
+            len(doc[i].get_text("text").strip()) < 50 for i in probe_pages
+        )
+
+    if is_scanned:
+        log.warning(f"{filename} appears to be a scanned image. Switching to AI OCR.")
+        return "", _submit_ai_ocr(doc)
+
+    # Image-only pages skip layout analysis and are transcribed by OCR instead, labelled by
+    # page after the markdown. Their requests are started first so they run while the text
+    # pages are converted. Pages with neither fonts nor images (blank separators, vector-only
+    # signatures or logos) have nothing to transcribe and are skipped.
+    text_pages = [i for i, fonts in enumerate(has_fonts) if fonts]
+    image_pages = [i for i, fonts in enumerate(has_fonts) if not fonts and doc.get_page_images(i)]
+    pending_ocr = _submit_ai_ocr(doc, image_pages) if image_pages else None
+
+    # --- Check 2: Try Standard Extraction ---
+    try:
+        if len(text_pages) >= PARALLEL_MARKDOWN_MIN_PAGES and MARKDOWN_MAX_WORKERS > 1:
+            text = _parallel_markdown(file_bytes, text_pages)
+        elif len(text_pages) > PAGES_PER_MARKDOWN_TASK:
+            text = batched_markdown(doc, text_pages)
+        elif image_pages:
+            text = str(pymupdf4llm.to_markdown(doc, pages=text_pages))
+        else:
+            text = str(pymupdf4llm.to_markdown(doc))
+
+    except Exception as e:
+        log.warning(f"Markdown extraction failed: {e}")
+
+        # --- Fallback: Raw text ---
+        text = "".join(doc[i].get_text() for i in text_pages)
+
+    # --- Final Fallback: AI OCR ---
+    # The text layer of scanned pages may hold nothing but a stamp or page numbers; if so,
+    # transcribe the pages with fonts too (within the OCR page limit)
+    if len(text.strip()) < 50:
+        log.warning(f"{filename} has almost no digital text. Switching to AI OCR.")
+        already = len(pending_ocr.pages) if pending_ocr else 0
+        retry = _submit_ai_ocr(doc, text_pages, limit=OCR_MAX_PAGES - already)
+        return "", _merge_ocr(pending_ocr, retry)
+
+    return text, pending_ocr
+
+
+def _extract_text(file_bytes: bytes, filename: str) -> tuple[str, bool]:
     """
     Extract text content from a PDF provided as bytes, auto-detecting the best extraction strategy.
 
     Extraction Workflow:
-        1. Open PDF and check if it contains any pages.
-        2. For the first page, check for available digital text.
-            - If no/very little text, assume scanned image and invoke AI OCR fallback.
+        1. Open PDF; skip password-protected files and files without pages.
+        2. Check which pages have fonts (a text layer), then probe the top of the first page
+           for digital text (and the whole first, middle and last pages if it has none).
+            - If no page has fonts, or none of the probes finds more than a little text,
+              assume a scanned image and invoke AI OCR fallback.
         3. Otherwise, attempt extraction to Markdown via PyMuPDF4LLM.
+            - Documents of 50+ pages are split into page ranges converted on a process pool.
+            - Image-only pages in an otherwise digital document are transcribed by AI OCR;
+              pages without fonts or images are skipped.
             - If extraction fails, logs warning and proceeds.
         4. If Markdown extraction is unsuccessful, fallback to extracting all raw text.
-            - If still insufficient text, fallback again to AI OCR.
+            - If the text is still under 50 characters, fallback again to AI OCR.
         5. Handles exceptions gracefully and returns empty string on unrecoverable error.
 
+    Page images for OCR are rendered while the document is open; the document is closed
+    before waiting on the vision LLM, so it isn't held in memory during the network I/O.
+    Documents are opened and parsed one at a time per worker process, across all requests
+    (PyMuPDF is not thread-safe); only the OCR waits of concurrent calls overlap.
+
     Args:
         file_bytes (bytes): The PDF file content as bytes.
         filename (str): The filename (for logging and diagnostics only).
 
     Returns:
-        str: The extracted text (markdown-formatted if possible, raw otherwise).
+        tuple[str, bool]: The extracted text (markdown-formatted if possible, raw otherwise), and
+            whether it is complete: False if any OCR page failed or extraction errored.
     """
     try:
-        with fitz.open(stream=file_bytes, filetype="pdf") as doc:
-            if doc.page_count == 0:
-                log.warning(f"⚠️ Document is empty: {filename}")
-                return ""
+        with _MUPDF_LOCK, fitz.open(stream=file_bytes, filetype="pdf") as doc:
+            text, pending_ocr = _extract_from_document(doc, file_bytes, filename)
 
-            # --- Check 1: Check If the pdf is a Scanned Image ---
-            first_page_text = doc[0].get_text()
-            is_scanned = len(first_page_text.strip()) < 50
+        if pending_ocr is None:
+            return text, True
+        ocr_text, ok = _collect_ai_ocr(pending_ocr)
+        return (f"{text}\n{ocr_text}" if text else ocr_text), ok
 
-            if is_scanned:
-                log.warning(f"{filename} appears to be a scanned image. Switching to AI OCR.")
-                return _perform_ai_ocr(doc)
+    except Exception as e:
+        log.error(f"❌ Critical Error parsing {filename}: {e}")
+        return "", False
 
-            # --- Check 2: Try Standard Extraction ---
-            try:
-                md_text = pymupdf4llm.to_markdown(doc)
-                return str(md_text)
 
-            except Exception as e:
-                log.warning(f"Markdown extraction failed: {e}")
+def extract_text_from_bytes(file_bytes: bytes, filename: str) -> str:
+    """
+    Extract text from a PDF, reusing the result when the same file content was seen before.
 
-            # --- Final Fallback: Try raw text or fallback to OCR ---
-            raw_text = ""
-            for page in doc:
-                raw_text += page.get_text()
+    Results are cached in-process by a BLAKE2b digest of the bytes, so re-submitted
+    files skip parsing and, for scanned documents, the AI OCR calls. Empty results and
+    results missing a failed OCR page are not cached, so the extraction is retried next time.
 
-            if len(raw_text.strip()) < 50:
-                ocr_result = _perform_ai_ocr(doc)
-                return ocr_result
+    Args:
+        file_bytes (bytes): The PDF file content as bytes.
+        filename (str): The filename (for logging and diagnostics only).
 
-            return str(raw_text)
+    Returns:
+        str: The extracted text (markdown-formatted if possible, raw otherwise).
+    """
+    digest = hashlib.blake2b(file_bytes, digest_size=16).digest()
+    with _TEXT_CACHE_LOCK:
+        cached = _TEXT_CACHE.get(digest)
+        if cached is not None:
+            _TEXT_CACHE.move_to_end(digest)
+    if cached is not None:
+        log.info(f"♻️ Reusing extracted text for {filename} (identical content seen before)")
+        return cached
 
-    except Exception as e:
-        log.error(f"❌ Critical Error parsing {filename}: {e}")
-        return ""
+    text, complete = _extract_text(file_bytes, filename)
+    if text and complete:
+        with _TEXT_CACHE_LOCK:
+            _TEXT_CACHE[digest] = text
+            while len(_TEXT_CACHE) > TEXT_CACHE_MAX_ITEMS:
+                _TEXT_CACHE.popitem(last=False)
+    return text
@@ -0,0 +1,9 @@
+import os
+
+# Settings are loaded at import time and require AWS credentials; tests never call AWS
+os.environ.setdefault("AWS_ACCESS_KEY", "test-access-key")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test-secret-key")
+os.environ.setdefault("AWS_BUCKET_NAME", "test-bucket")
+
+# Import the graph package first, as the app does: the agents and the graph import each other
+import src.ai.graph  # noqa: F401
@@ -0,0 +1,108 @@
+import json
+from typing import Any
+
+from src.ai.agent.claim_agent import _precheck_claim
+from src.ai.graph.state import ClassifiedDocument, ExtractedDocument
+from src.schema.enum import DocStatus, DocumentType, Severity
+
+
+def _extracted(doc_type: DocumentType, **data: Any) -> ExtractedDocument:
+    return ExtractedDocument(
+        filename=f"{doc_type.value}.pdf", doc_type=doc_type, data=json.dumps(data)
+    )
+
+
+def _classified(*doc_types: DocumentType) -> list[ClassifiedDocument]:
+    return [
+        ClassifiedDocument(filename=f"{i}.pdf", doc_type=t, reasoning="", confidence=0.9)
+        for i, t in enumerate(doc_types)
+    ]
+
+
+def test_missing_discharge_summary_is_rejected() -> None:
+    docs = [_extracted(DocumentType.BILL, bill_date="2025-01-05")]
+
+    report = _precheck_claim(docs, _classified(DocumentType.BILL))
+
+    assert report is not None
+    assert report.status == DocStatus.REJECTED
+    assert report.missing_documents == [DocumentType.DISCHARGE_SUMMARY]
+
+
+def test_missing_both_mandatory_documents_lists_both() -> None:
+    report = _precheck_claim([], _classified(DocumentType.ID_CARD))
+
+    assert report is not None
+    assert report.status == DocStatus.REJECTED
+    assert report.missing_documents == [DocumentType.BILL, DocumentType.DISCHARGE_SUMMARY]
+
+
+def test_missing_document_with_unclassified_input_needs_manual_review() -> None:
+    docs = [_extracted(DocumentType.BILL, bill_date="2025-01-05")]
+
+    report = _precheck_claim(docs, _classified(DocumentType.BILL, DocumentType.OTHER))
+
+    assert report is not None
+    assert report.status == DocStatus.MANUAL_REVIEW
+    assert report.missing_documents == [DocumentType.DISCHARGE_SUMMARY]
+    assert "could not be classified" in report.reason
+
+
+def test_pharmacy_bill_satisfies_the_bill_requirement() -> None:
+    docs = [
+        _extracted(DocumentType.PHARMACY_BILL, bill_date="2025-01-05"),
+        _extracted(
+            DocumentType.DISCHARGE_SUMMARY,
+            admission_date="2025-01-02",
+            discharge_date="2025-01-06",
+        ),
+    ]
+
+    classified = _classified(DocumentType.PHARMACY_BILL, DocumentType.DISCHARGE_SUMMARY)
+    assert _precheck_claim(docs, classified) is None
+
+
+def test_discharge_before_admission_needs_manual_review() -> None:
+    docs = [
+        _extracted(DocumentType.BILL, bill_date="2025-01-05"),
+        _extracted(
+            DocumentType.DISCHARGE_SUMMARY,
+            admission_date="2025-01-04",
+            discharge_date="2025-01-02",
+        ),
+    ]
+
+    report = _precheck_claim(docs, _classified(DocumentType.BILL, DocumentType.DISCHARGE_SUMMARY))
+
+    assert report is not None
+    assert report.status == DocStatus.MANUAL_REVIEW
+    assert [(d.field, d.severity) for d in report.discrepancies] == [
+        ("discharge_date", Severity.HIGH)
+    ]
+
+
+def test_bill_before_admission_needs_manual_review() -> None:
+    docs = [
+        _extracted(DocumentType.BILL, bill_date="2024-12-30"),
+        _extracted(
+            DocumentType.DISCHARGE_SUMMARY,
+            admission_date="2025-01-02",
+            discharge_date="2025-01-06",
+        ),
+    ]
+
+    report = _precheck_claim(docs, _classified(DocumentType.BILL, DocumentType.DISCHARGE_SUMMARY))
+
+    assert report is not None
+    assert report.status == DocStatus.MANUAL_REVIEW
+    assert [(d.field, d.severity) for d in report.discrepancies] == [("bill_date", Severity.MEDIUM)]
+
+
+def test_unparseable_dates_are_left_to_llm() -> None:
+    docs = [
+        _extracted(DocumentType.BILL, bill_date="05/01/2025"),
+        _extracted(DocumentType.DISCHARGE_SUMMARY, admission_date="yesterday"),
+    ]
+
+    classified = _classified(DocumentType.BILL, DocumentType.DISCHARGE_SUMMARY)
+    assert _precheck_claim(docs, classified) is None
@@ -0,0 +1,55 @@
+from src.ai.fast_classify import _SCAN_CHARS, fast_classify
+from src.schema.enum import DocumentType
+
+DISCHARGE_TEXT = """
+CITY HOSPITAL - DISCHARGE SUMMARY
+Date of Admission: 2025-01-02    Date of Discharge: 2025-01-06
+Final Diagnosis: Acute appendicitis
+"""
+
+
+def test_clear_text_signals_classify_without_llm() -> None:
+    result = fast_classify("document.pdf", DISCHARGE_TEXT)
+
+    assert result is not None
+    doc_type, reasoning = result
+    assert doc_type == DocumentType.DISCHARGE_SUMMARY
+    assert reasoning.startswith("Keyword prefilter (4 vs 0)")
+    assert "final diagnosis" in reasoning
+
+
+def test_single_keyword_is_below_min_score() -> None:
+    assert fast_classify("document.pdf", "Invoice No: 4411") is None
+
+
+def test_filename_match_adds_a_point() -> None:
+    result = fast_classify("hospital_bill.pdf", "Grand Total: 1,200.00")
+
+    assert result is not None
+    doc_type, reasoning = result
+    assert doc_type == DocumentType.BILL
+    assert reasoning.endswith("+ filename")
+
+
+def test_filename_alone_is_not_enough() -> None:
+    assert fast_classify("invoice.pdf", "Nothing recognisable here") is None
+
+
+def test_close_scores_are_left_to_llm() -> None:
+    text = "Invoice No: 1\nGrand Total: 10\nCity Pharmacy\nBatch No: A1"
+
+    assert fast_classify("scan.pdf", text) is None
+
+
+def test_pharmacy_filename_does_not_also_count_as_bill() -> None:
+    text = "Pharmacy\nDrug Licence: 22\nMRP 40.00"
+    result = fast_classify("pharmacy_bill.pdf", text)
+
+    assert result is not None
+    assert result[0] == DocumentType.PHARMACY_BILL
+
+
+def test_only_document_head_is_scanned() -> None:
+    text = " " * _SCAN_CHARS + DISCHARGE_TEXT
+
+    assert fast_classify("document.pdf", text) is None
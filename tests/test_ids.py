@@ -0,0 +1,43 @@
+import time
+import uuid
+
+import pytest
+
+from src.utils import ids
+
+
+@pytest.fixture(params=["stdlib", "fallback"])
+def uuid7_impl(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "stdlib":
+        if ids._stdlib_uuid7 is None:
+            pytest.skip("uuid.uuid7 needs Python 3.14+")
+    else:
+        monkeypatch.setattr(ids, "_stdlib_uuid7", None)
+    return str(request.param)
+
+
+def test_version_and_variant(uuid7_impl: str) -> None:
+    value = ids.uuid7()
+
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+
+
+def test_embeds_current_unix_millis(uuid7_impl: str) -> None:
+    before = time.time_ns() // 1_000_000
+    value = ids.uuid7()
+    after = time.time_ns() // 1_000_000
+
+    assert before <= value.int >> 80 <= after
+
+
+def test_later_ids_sort_later(uuid7_impl: str) -> None:
+    first = ids.uuid7()
+    time.sleep(0.002)
+    second = ids.uuid7()
+
+    assert str(first) < str(second)
+
+
+def test_ids_are_unique(uuid7_impl: str) -> None:
+    assert len({ids.uuid7() for _ in range(1000)}) == 1000
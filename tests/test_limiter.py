@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi_limiter.depends import RateLimiter
+
+from src.utils import limiter as limiter_module
+from src.utils.limiter import CachedRateLimiter
+
+
+class FakeRedisCheck:
+    """Stands in for RateLimiter._check (the EVALSHA call), returning queued TTLs in ms.
+
+    Instances are not descriptors, so the patched class attribute is called with the key only.
+    """
+
+    def __init__(self, *responses: int) -> None:
+        self.responses = list(responses)
+        self.calls: list[str] = []
+
+    async def __call__(self, key: str) -> int:
+        self.calls.append(key)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    fake = SimpleNamespace(now_ns=1_000_000_000_000)
+    monkeypatch.setattr(limiter_module, "time", SimpleNamespace(monotonic_ns=lambda: fake.now_ns))
+    return fake
+
+
+def _advance(clock: SimpleNamespace, ms: int) -> None:
+    clock.now_ns += ms * 1_000_000
+
+
+@pytest.mark.asyncio
+async def test_allowed_requests_always_reach_redis(
+    monkeypatch: pytest.MonkeyPatch, clock: SimpleNamespace
+) -> None:
+    check = FakeRedisCheck(0, 0)
+    monkeypatch.setattr(RateLimiter, "_check", check)
+    limiter = CachedRateLimiter(times=3, seconds=60)
+
+    assert await limiter._check("ip") == 0
+    assert await limiter._check("ip") == 0
+    assert check.calls == ["ip", "ip"]
+
+
+@pytest.mark.asyncio
+async def test_rejection_is_answered_locally_until_window_ends(
+    monkeypatch: pytest.MonkeyPatch, clock: SimpleNamespace
+) -> None:
+    check = FakeRedisCheck(5_000, 0)
+    monkeypatch.setattr(RateLimiter, "_check", check)
+    limiter = CachedRateLimiter(times=3, seconds=60)
+
+    assert await limiter._check("ip") == 5_000
+    _advance(clock, 1_000)
+    assert await limiter._check("ip") == 4_000
+    _advance(clock, 3_999)
+    assert await limiter._check("ip") == 1
+    assert check.calls == ["ip"]
+
+    # Window over: the next request goes back to Redis
+    _advance(clock, 1)
+    assert await limiter._check("ip") == 0
+    assert check.calls == ["ip", "ip"]
+
+
+@pytest.mark.asyncio
+async def test_rejections_are_tracked_per_key(
+    monkeypatch: pytest.MonkeyPatch, clock: SimpleNamespace
+) -> None:
+    check = FakeRedisCheck(5_000, 0)
+    monkeypatch.setattr(RateLimiter, "_check", check)
+    limiter = CachedRateLimiter(times=3, seconds=60)
+
+    assert await limiter._check("blocked") == 5_000
+    assert await limiter._check("other") == 0
+    assert check.calls == ["blocked", "other"]
+
+
+@pytest.mark.asyncio
+async def test_blocked_keys_are_capped(
+    monkeypatch: pytest.MonkeyPatch, clock: SimpleNamespace
+) -> None:
+    check = FakeRedisCheck(5_000, 5_000, 5_000, 5_000)
+    monkeypatch.setattr(RateLimiter, "_check", check)
+    monkeypatch.setattr(CachedRateLimiter, "_MAX_BLOCKED_KEYS", 2)
+    limiter = CachedRateLimiter(times=3, seconds=60)
+
+    for key in ("a", "b", "c"):
+        await limiter._check(key)
+
+    assert list(limiter._blocked_until) == ["b", "c"]
+    # The evicted key is checked against Redis again
+    await limiter._check("a")
+    assert check.calls == ["a", "b", "c", "a"]
@@ -0,0 +1,56 @@
+import ast
+from pathlib import Path
+
+from src.ai import prompts
+from src.ai.agent import claim_agent, extraction_agent
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+PROMPT_NAMES = {
+    "CLASSIFICATION_SYSTEM_PROMPT",
+    "BILL_EXTRACTION_SYSTEM_PROMPT",
+    "DISCHARGE_EXTRACTION_SYSTEM_PROMPT",
+    "ID_CARD_EXTRACTION_SYSTEM_PROMPT",
+    "CLAIM_VALIDATION_SYSTEM_PROMPT",
+}
+
+
+def _prompt_assignments() -> list[tuple[Path, str, bool]]:
+    """(file, name, is Final) for every module-level assignment of a system prompt name."""
+    found = []
+    for path in SRC_DIR.rglob("*.py"):
+        for node in ast.parse(path.read_text(encoding="utf-8")).body:
+            if isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+                is_final = isinstance(node.annotation, ast.Name) and node.annotation.id == "Final"
+                found.append((path, node.target.id, is_final))
+            elif isinstance(node, ast.Assign):
+                found.extend(
+                    (path, target.id, False)
+                    for target in node.targets
+                    if isinstance(target, ast.Name)
+                )
+    return [item for item in found if item[1] in PROMPT_NAMES]
+
+
+def test_each_prompt_is_defined_once_as_final_in_prompts_module() -> None:
+    assignments = _prompt_assignments()
+
+    assert sorted(name for _, name, _ in assignments) == sorted(PROMPT_NAMES)
+    for path, name, is_final in assignments:
+        assert path == SRC_DIR / "ai" / "prompts.py", f"{name} redefined in {path}"
+        assert is_final, f"{name} is not annotated Final"
+
+
+def test_system_messages_reuse_the_canonical_prompt_objects() -> None:
+    # Identical objects keep the provider prompt-cache prefix stable
+    assert extraction_agent.BILL_SYSTEM_MESSAGE.content is prompts.BILL_EXTRACTION_SYSTEM_PROMPT
+    assert (
+        extraction_agent.DISCHARGE_SYSTEM_MESSAGE.content
+        is prompts.DISCHARGE_EXTRACTION_SYSTEM_PROMPT
+    )
+    assert (
+        extraction_agent.ID_CARD_SYSTEM_MESSAGE.content is prompts.ID_CARD_EXTRACTION_SYSTEM_PROMPT
+    )
+    assert (
+        claim_agent.CLAIM_VALIDATION_SYSTEM_MESSAGE.content
+        is prompts.CLAIM_VALIDATION_SYSTEM_PROMPT
+    )
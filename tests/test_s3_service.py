@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.service import s3_service
+from src.service.s3_service import UPLOAD_FOLDER, S3Manager
+
+TIMESTAMP_US = 1_700_000_000_123_456
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch) -> S3Manager:
+    monkeypatch.setattr(
+        s3_service, "time", SimpleNamespace(time_ns=lambda: TIMESTAMP_US * 1000 + 789)
+    )
+    return S3Manager()
+
+
+@pytest.mark.parametrize(
+    ("filename", "expected_name"),
+    [
+        ("report.pdf", f"report_{TIMESTAMP_US}.pdf"),
+        ("archive.tar.gz", f"archive.tar_{TIMESTAMP_US}.gz"),
+        ("noext", f"noext_{TIMESTAMP_US}"),
+        (".env", f".env_{TIMESTAMP_US}"),
+        ("trailing.", f"trailing._{TIMESTAMP_US}"),
+        ("a/b.pdf", f"b_{TIMESTAMP_US}.pdf"),
+        ("../../etc/x.pdf", f"x_{TIMESTAMP_US}.pdf"),
+        ("..\\x.pdf", f"x_{TIMESTAMP_US}.pdf"),
+        ("C:\\Users\\me\\scan.pdf", f"scan_{TIMESTAMP_US}.pdf"),
+    ],
+)
+def test_build_file_key(manager: S3Manager, filename: str, expected_name: str) -> None:
+    assert manager._build_file_key(filename) == f"{UPLOAD_FOLDER}/{expected_name}"
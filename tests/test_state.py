@@ -0,0 +1,55 @@
+from src.ai.graph.state import ClaimState, DocumentInput, get_raw_text
+from src.api.v1.claim import _unique_filename
+
+
+def _state(*files: tuple[str, str]) -> ClaimState:
+    return {
+        "inputs": [
+            DocumentInput(filename=name, raw_text=text, claim_id="claim-1") for name, text in files
+        ],
+        "classified_docs": [],
+        "extracted_documents": [],
+        "validation_report": None,
+    }
+
+
+def test_get_raw_text_finds_the_named_input() -> None:
+    state = _state(("bill.pdf", "bill text"), ("summary.pdf", "summary text"))
+
+    assert get_raw_text(state, "summary.pdf") == "summary text"
+    assert get_raw_text(state, "bill.pdf") == "bill text"
+
+
+def test_get_raw_text_of_unknown_file_is_empty() -> None:
+    assert get_raw_text(_state(("bill.pdf", "bill text")), "other.pdf") == ""
+
+
+def test_unique_filename_numbers_repeated_names() -> None:
+    seen: set[str] = set()
+    names = []
+    for name in ["scan.pdf", "scan.pdf", "scan (2).pdf", "scan.pdf", "README", "README"]:
+        unique = _unique_filename(name, seen)
+        seen.add(unique)
+        names.append(unique)
+
+    assert names == [
+        "scan.pdf",
+        "scan (2).pdf",
+        "scan (2) (2).pdf",
+        "scan (3).pdf",
+        "README",
+        "README (2)",
+    ]
+
+
+def test_duplicate_uploads_keep_their_own_text() -> None:
+    seen: set[str] = set()
+    inputs = []
+    for text in ("first scan", "second scan"):
+        doc = DocumentInput(filename="scan.pdf", raw_text=text, claim_id="claim-1")
+        doc.filename = _unique_filename(doc.filename, seen)
+        seen.add(doc.filename)
+        inputs.append(doc)
+    state = _state(*((doc.filename, doc.raw_text) for doc in inputs))
+
+    assert [get_raw_text(state, doc.filename) for doc in inputs] == ["first scan", "second scan"]